@@ -1,7 +1,112 @@
+import sys
 import time
+import heapq
 import hashlib
-from typing import List, Dict, Any, Optional
-from collections import Counter
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Callable, Optional, Set, Tuple
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+
+from word_tokenizer import tokenize
+
+try:
+    import numpy as np
+except ImportError:  # batch association falls back to per-thought indexing
+    np = None
+
+
+# CPython 3.12 makes interned strings immortal, so interning thoughts
+# there would keep evicted ones alive for the life of the process
+_INTERN_THOUGHTS = sys.version_info[:2] != (3, 12)
+
+
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset:
+    """
+    Lowercased, punctuation-free word set of a text. Cached so repeated
+    thoughts and queries share one frozenset instead of re-tokenizing.
+    """
+    return frozenset(tokenize(text))
+
+
+def _select_associations(overlaps: Dict[int, int], by_seq: Dict[int, int],
+                         stored_words: List[Optional[frozenset]], word_count: int,
+                         threshold: float) -> List[int]:
+    """
+    Slots of the live candidates whose word-overlap strength exceeds
+    threshold, in insertion (seq) order.
+    """
+    selected = []
+    for other in sorted(overlaps):
+        other_slot = by_seq.get(other)
+        if other_slot is None:
+            # Evicted earlier in the same batch
+            continue
+        overlap = overlaps[other]
+        union = word_count + len(stored_words[other_slot]) - overlap
+        if overlap / max(union, 1) > threshold:
+            selected.append(other_slot)
+    return selected
+
+
+def _rank_recall(overlaps: Dict[int, int], by_seq: Dict[int, int],
+                 importance) -> List[Tuple[float, int]]:
+    """
+    (score, seq) pairs ranked by overlap * importance, highest first;
+    ties keep insertion order.
+    """
+    scored = [(overlaps[seq] * importance[by_seq[seq]], seq) for seq in sorted(overlaps)]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return scored
+
+
+try:
+    # Compiled versions of the two helpers above, built with
+    # `cythonize -i _infinite_mind_core.pyx`
+    from _infinite_mind_core import select_associations as _fast_select_associations
+    from _infinite_mind_core import rank_recall as _fast_rank_recall
+except ImportError:
+    _fast_select_associations = _select_associations
+    _fast_rank_recall = _rank_recall
+
+
+class ThoughtsView(Sequence):
+    """
+    Read-only, live view of an InfiniteMind's stored thoughts in
+    insertion order, each read through project(slot). Indexing and len()
+    are O(1); use list(view) to keep a fixed copy.
+    """
+
+    __slots__ = ('_mind', '_project')
+
+    def __init__(self, mind: 'InfiniteMind', project: Callable[[int], Any]):
+        self._mind = mind
+        self._project = project
+
+    def __len__(self) -> int:
+        return len(self._mind._order)
+
+    def __getitem__(self, index):
+        by_seq = self._mind._by_seq
+        if isinstance(index, slice):
+            return [self._project(by_seq[seq]) for seq in self._mind._order[index]]
+        return self._project(by_seq[self._mind._order[index]])
+
+    def __iter__(self):
+        return map(self._project, self._mind._by_seq.values())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, ThoughtsView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'ThoughtsView({!r})'.format(list(self))
 
 
 class InfiniteMind:
@@ -18,92 +123,310 @@ class InfiniteMind:
 
     VERSION = "2.1.33"
     MAX_THOUGHT_DEPTH = 10
+    RECALL_CACHE_SIZE = 1024
+    ASSOCIATION_THRESHOLD = 0.1
+    PREALLOCATE_LIMIT = 65536
+    BATCH_VECTORIZE_MIN = 64
+    INTERN_MAX_LENGTH = 512
 
     def __init__(self, capacity: int = 10000):
         """Initialize thought storage with optional capacity limit."""
-        self.thoughts: List[Dict[str, Any]] = []
-        self.raw_thoughts: List[str] = []
         self.associations: Dict[str, List[str]] = {}
         self.importance_scores: Dict[str, float] = {}
-        self.thought_frequency: Counter = Counter()
+        self.thought_frequency: Dict[str, int] = {}
         self.evolution_history: List[Dict[str, Any]] = []
         self.capacity = capacity
+        # Thought fields stored column-wise and indexed by storage slot,
+        # sized up front for capacity (plus the one extra thought held
+        # before an eviction)
+        slots = min(max(capacity, 0) + 1, self.PREALLOCATE_LIMIT)
+        self._contents: List[Optional[str]] = [None] * slots
+        self._ids: List[Optional[str]] = [None] * slots
+        self._words: List[Optional[frozenset]] = [None] * slots
+        self._links: List[Optional[List[str]]] = [None] * slots
+        self._importance = array('d', bytes(8 * slots))
+        self._timestamp = array('d', bytes(8 * slots))
+        self._depth = array('B', bytes(slots))
+        self._free_slots: List[int] = list(range(slots - 1, -1, -1))
+        # Inverted index: word -> sequence numbers of thoughts containing it
+        self._word_index: Dict[str, Set[int]] = {}
+        # Slots of live thoughts keyed by sequence number, in insertion order
+        self._by_seq: Dict[int, int] = {}
+        # Sequence numbers of live thoughts in insertion order, kept as a
+        # list so positional access through the views stays O(1)
+        self._order: List[int] = []
+        self._thoughts_view = ThoughtsView(self, self._row)
+        self._raw_thoughts_view = ThoughtsView(self, self._contents.__getitem__)
+        # Min-heap of (importance, seq) used to pick eviction victims
+        self._importance_heap: List[Tuple[float, int]] = []
+        self._next_seq = 0
+        # Running totals backing get_knowledge_summary
+        self._importance_total = 0.0
+        self._content_counts: Dict[str, int] = {}
+        self._association_total = 0
+        # LRU cache of recall rankings, as (score, slot) pairs keyed by
+        # (query, top_k); cleared whenever the stored thoughts change
+        self._recall_cache: OrderedDict = OrderedDict()
         self._creation_time = time.time()
 
+    @property
+    def thoughts(self) -> ThoughtsView:
+        """
+        Live, read-only view of the stored thoughts in insertion order.
+        Entries are dict snapshots; changing them does not update the mind.
+        """
+        return self._thoughts_view
+
+    @property
+    def raw_thoughts(self) -> ThoughtsView:
+        """
+        Live, read-only view of the stored thoughts' content in insertion
+        order; use list(mind.raw_thoughts) to keep a snapshot.
+        """
+        return self._raw_thoughts_view
+
     def expand(self, thoughts, importance: float = 1.0):
         """
         Add thoughts to memory with importance weighting.
-        Returns all collected thoughts.
+        Returns all collected thoughts (the live raw_thoughts view).
         """
         if not isinstance(thoughts, list):
             thoughts = [thoughts]
 
-        for thought in thoughts:
-            thought_str = str(thought)
-            self.raw_thoughts.append(thought_str)
-
-            # Create structured thought entry
-            entry = {
-                'content': thought_str,
-                'importance': importance,
-                'timestamp': time.time(),
-                'id': hashlib.md5(thought_str.encode()).hexdigest()[:12],
-                'depth': 0,
-                'associations': [],
-            }
-            self.thoughts.append(entry)
+        # Intern short thoughts so the several dicts keyed by content
+        # share one string object and compare by identity
+        thought_strs = [
+            sys.intern(t) if _INTERN_THOUGHTS and len(t) < self.INTERN_MAX_LENGTH else t
+            for t in map(str, thoughts)
+        ]
+        batch_overlaps = None
+        # Batch members indexed so far, for associations within the batch
+        batch_index: Dict[str, List[int]] = {}
+        if np is not None and len(thought_strs) >= self.BATCH_VECTORIZE_MIN and self._by_seq:
+            batch_overlaps = self._batch_overlaps([_word_set(t) for t in thought_strs])
+
+        for i, thought_str in enumerate(thought_strs):
+            # Store the thought's fields in a free column slot
+            slot = self._allocate_slot()
+            seq = self._next_seq
+            self._next_seq += 1
+            self._contents[slot] = thought_str
+            self._ids[slot] = hashlib.blake2b(thought_str.encode(), digest_size=6).hexdigest()
+            self._words[slot] = _word_set(thought_str)
+            self._links[slot] = []
+            self._importance[slot] = importance
+            self._timestamp[slot] = time.time()
+            self._depth[slot] = 0
             self.importance_scores[thought_str] = importance
-            self.thought_frequency[thought_str] += 1
+            self.thought_frequency[thought_str] = self.thought_frequency.get(thought_str, 0) + 1
 
             # Build associations with existing thoughts
-            self._build_associations(entry)
+            if batch_overlaps is None:
+                self._build_associations(seq, slot)
+            else:
+                words = self._words[slot]
+                overlaps = batch_overlaps[i]
+                overlaps.update(Counter(chain.from_iterable(
+                    batch_index[word] for word in words if word in batch_index
+                )))
+                for word in words:
+                    batch_index.setdefault(word, []).append(seq)
+                self._build_associations(seq, slot, overlaps)
 
             # Evict least important if over capacity
-            if len(self.thoughts) > self.capacity:
+            if len(self._by_seq) > self.capacity:
                 self._evict_least_important()
 
-        return self.raw_thoughts
+        return self._raw_thoughts_view
 
-    def _build_associations(self, entry: Dict[str, Any]):
-        """Build word-level associations between thoughts."""
-        words = set(entry['content'].lower().split())
-        content_key = entry['content']
+    def _allocate_slot(self) -> int:
+        """Take a free column slot, growing the columns if none is left."""
+        if self._free_slots:
+            return self._free_slots.pop()
+        for column in (self._contents, self._ids, self._words, self._links):
+            column.append(None)
+        self._importance.append(0.0)
+        self._timestamp.append(0.0)
+        self._depth.append(0)
+        return len(self._importance) - 1
+
+    def _row(self, slot: int) -> Dict[str, Any]:
+        """Assemble a dict snapshot of the thought stored in slot."""
+        return {
+            'content': self._contents[slot],
+            'importance': self._importance[slot],
+            'timestamp': self._timestamp[slot],
+            'id': self._ids[slot],
+            'depth': self._depth[slot],
+            'associations': list(self._links[slot]),
+        }
+
+    def _build_associations(self, seq: int, slot: int,
+                            overlaps: Optional[Dict[int, int]] = None):
+        """
+        Build word-level associations between thoughts.
+        Only thoughts sharing at least one word are visited, via the
+        inverted word index, unless precomputed overlaps are given.
+        """
+        words = self._words[slot]
+        content_key = self._contents[slot]
         self.associations.setdefault(content_key, [])
+        if overlaps is None:
+            overlaps = self._candidate_overlaps(words)
+
+        # Visit candidates in insertion order to keep association order stable
+        links = self._links[slot]
+        for other_slot in _fast_select_associations(
+            overlaps, self._by_seq, self._words, len(words), self.ASSOCIATION_THRESHOLD
+        ):
+            other_content = self._contents[other_slot]
+            self.associations[content_key].append(other_content)
+            self.associations.setdefault(other_content, []).append(content_key)
+            links.append(self._ids[other_slot])
+            self._association_total += 2
 
-        for existing in self.thoughts[:-1]:
-            existing_words = set(existing['content'].lower().split())
-            overlap = words & existing_words
-            if overlap:
-                strength = len(overlap) / max(len(words | existing_words), 1)
-                if strength > 0.1:
-                    self.associations[content_key].append(existing['content'])
-                    self.associations.setdefault(existing['content'], []).append(content_key)
-                    entry['associations'].append(existing['id'])
+        self._index_thought(seq, slot)
+
+    def _candidate_overlaps(self, words: frozenset) -> Dict[int, int]:
+        """Overlap counts, keyed by seq, for thoughts that may associate with words."""
+        by_seq = self._by_seq
+        stored_words = self._words
+        word_count = len(words)
+        # Prefix filter: strength > t needs more than t * len(words) shared
+        # words, so an associated thought must contain at least one of any
+        # len(words) - int(t * len(words)) of our words. Probing the rarest
+        # ones skips the longest posting lists without losing matches.
+        probe_count = word_count - int(self.ASSOCIATION_THRESHOLD * word_count)
+        if probe_count < word_count:
+            index = self._word_index
+            probes = sorted(words, key=lambda w: len(index.get(w, ())))[:probe_count]
+            candidates = set().union(*(index[w] for w in probes if w in index))
+            return {
+                other: len(words & stored_words[by_seq[other]]) for other in candidates
+            }
+        return self._tally_overlaps(words)
+
+    def _batch_overlaps(self, word_sets: List[frozenset]) -> List[Dict[int, int]]:
+        """
+        Overlap counts of each new word set against the thoughts stored
+        before the batch, keeping only pairs above the association
+        threshold. Each posting list is converted to a slot array once
+        per batch, and counting and filtering run in NumPy.
+        """
+        by_seq = self._by_seq
+        n_slots = len(self._importance)
+        live_slots = np.fromiter(by_seq.values(), dtype=np.int64, count=len(by_seq))
+        slot_seq = np.full(n_slots, -1, dtype=np.int64)
+        slot_seq[live_slots] = np.fromiter(by_seq.keys(), dtype=np.int64, count=len(by_seq))
+        word_len = np.zeros(n_slots, dtype=np.int64)
+        word_len[live_slots] = [len(self._words[slot]) for slot in by_seq.values()]
+
+        postings: Dict[str, Any] = {}
+        results = []
+        for words in word_sets:
+            arrays = []
+            for word in words:
+                slots = postings.get(word)
+                if slots is None:
+                    seqs = self._word_index.get(word, ())
+                    slots = np.fromiter((by_seq[s] for s in seqs), dtype=np.int64, count=len(seqs))
+                    postings[word] = slots
+                if len(slots):
+                    arrays.append(slots)
+            if not arrays:
+                results.append({})
+                continue
+            candidates, overlap = np.unique(np.concatenate(arrays), return_counts=True)
+            union = len(words) + word_len[candidates] - overlap
+            keep = overlap / np.maximum(union, 1) > self.ASSOCIATION_THRESHOLD
+            results.append(dict(zip(slot_seq[candidates[keep]].tolist(), overlap[keep].tolist())))
+        return results
+
+    def _tally_overlaps(self, words: frozenset) -> Counter:
+        """
+        Count shared words per stored thought (keyed by seq).
+        Counter's C counting loop consumes the chained posting sets
+        directly, avoiding a Python-level increment per posting.
+        """
+        index = self._word_index
+        return Counter(chain.from_iterable(
+            index[word] for word in words if word in index
+        ))
+
+    def _index_thought(self, seq: int, slot: int):
+        """Register a thought in the inverted word index."""
+        self._by_seq[seq] = slot
+        self._order.append(seq)
+        self._recall_cache.clear()
+        importance = self._importance[slot]
+        heapq.heappush(self._importance_heap, (importance, seq))
+        self._importance_total += importance
+        content = self._contents[slot]
+        self._content_counts[content] = self._content_counts.get(content, 0) + 1
+        for word in self._words[slot]:
+            self._word_index.setdefault(word, set()).add(seq)
+
+    def _unindex_thought(self, seq: int):
+        """Remove a thought from the inverted word index and free its slot."""
+        slot = self._by_seq.pop(seq)
+        # Sequence numbers only grow, so _order is sorted
+        position = bisect_left(self._order, seq)
+        del self._order[position]
+        self._recall_cache.clear()
+        self._importance_total -= self._importance[slot]
+        content = self._contents[slot]
+        if self._content_counts[content] == 1:
+            del self._content_counts[content]
+        else:
+            self._content_counts[content] -= 1
+        for word in self._words[slot]:
+            postings = self._word_index[word]
+            postings.discard(seq)
+            if not postings:
+                del self._word_index[word]
+        for column in (self._contents, self._ids, self._words, self._links):
+            column[slot] = None
+        self._free_slots.append(slot)
 
     def _evict_least_important(self):
-        """Remove lowest-importance thought when over capacity."""
-        if not self.thoughts:
-            return
-        min_idx = min(range(len(self.thoughts)), key=lambda i: self.thoughts[i]['importance'])
-        evicted = self.thoughts.pop(min_idx)
-        if evicted['content'] in self.raw_thoughts:
-            self.raw_thoughts.remove(evicted['content'])
+        """
+        Remove lowest-importance thought when over capacity.
+        Ties go to the oldest thought; heap entries for thoughts that
+        are no longer stored are discarded lazily.
+        """
+        while self._importance_heap:
+            _, seq = heapq.heappop(self._importance_heap)
+            if seq in self._by_seq:
+                self._unindex_thought(seq)
+                return
 
     def recall(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
         Associative recall: find thoughts most related to query.
         Uses word overlap scoring with importance weighting.
+        Rankings are cached until the stored thoughts change; every call
+        returns freshly built rows, so callers may modify them.
         """
-        query_words = set(query.lower().split())
-        scored = []
-        for thought in self.thoughts:
-            thought_words = set(thought['content'].lower().split())
-            overlap = len(query_words & thought_words)
-            if overlap > 0:
-                score = overlap * thought['importance']
-                scored.append({'thought': thought, 'relevance': score})
-        scored.sort(key=lambda x: x['relevance'], reverse=True)
-        return scored[:top_k]
+        key = (query, top_k)
+        ranked = self._recall_cache.get(key)
+        if ranked is None:
+            ranked = self._score_recall(query, top_k)
+            self._recall_cache[key] = ranked
+            if len(self._recall_cache) > self.RECALL_CACHE_SIZE:
+                self._recall_cache.popitem(last=False)
+        else:
+            self._recall_cache.move_to_end(key)
+        return [
+            {'thought': self._row(slot), 'relevance': score}
+            for score, slot in ranked
+        ]
+
+    def _score_recall(self, query: str, top_k: int) -> List[Tuple[float, int]]:
+        """Score stored thoughts against query and return the top_k (score, slot) pairs."""
+        overlaps = self._tally_overlaps(_word_set(query))
+        by_seq = self._by_seq
+        scored = _fast_rank_recall(overlaps, by_seq, self._importance)
+        return [(score, by_seq[seq]) for score, seq in scored[:top_k]]
 
     def evolve_thought(self, thought: str, depth: int = 0) -> str:
         """
@@ -120,15 +443,12 @@ class InfiniteMind:
 
         # Combine with top association
         top_related = related[0]['thought']['content']
-        # Merge unique words (set union preserving order)
-        words_a = thought.split()
-        words_b = top_related.split()
-        seen = set()
-        evolved_words = []
-        for w in words_a + words_b:
-            if w.lower() not in seen:
-                seen.add(w.lower())
-                evolved_words.append(w)
+        # Merge unique words (case-insensitive union preserving order);
+        # the first spelling of each word wins
+        words = thought.split() + top_related.split()
+        lowered = list(map(str.lower, words))
+        first_spelling = dict(zip(reversed(lowered), reversed(words)))
+        evolved_words = [first_spelling[w] for w in dict.fromkeys(lowered)]
 
         evolved = ' '.join(evolved_words)
         self.evolution_history.append({
@@ -143,7 +463,7 @@ class InfiniteMind:
         """
         Score how novel a thought is (0.0 = seen before, 1.0 = completely new).
         """
-        if not self.thoughts:
+        if not self._by_seq:
             return 1.0
         related = self.recall(thought, top_k=1)
         if not related:
@@ -152,8 +472,8 @@ class InfiniteMind:
 
     def get_knowledge_summary(self) -> Dict[str, Any]:
         """Return summary of accumulated knowledge."""
-        total = len(self.thoughts)
-        avg_importance = sum(t['importance'] for t in self.thoughts) / max(total, 1)
+        total = len(self._by_seq)
+        avg_importance = self._importance_total / max(total, 1)
         most_connected = max(
             self.associations.items(),
             key=lambda x: len(x[1]),
@@ -162,9 +482,9 @@ class InfiniteMind:
         return {
             'version': self.VERSION,
             'total_thoughts': total,
-            'unique_thoughts': len(set(self.raw_thoughts)),
+            'unique_thoughts': len(self._content_counts),
             'avg_importance': round(avg_importance, 4),
-            'total_associations': sum(len(v) for v in self.associations.values()),
+            'total_associations': self._association_total,
             'most_connected_thought': most_connected[0][:80],
             'most_connected_count': len(most_connected[1]),
             'evolution_steps': len(self.evolution_history),
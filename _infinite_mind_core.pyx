@@ -0,0 +1,53 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled scoring loops for InfiniteMindQuantized.
+
+Build in place with ``cythonize -i _infinite_mind_core.pyx``. When the
+extension is not built, InfiniteMindQuantized uses its pure-Python
+versions of these functions, which return identical results.
+"""
+
+
+def _score(pair):
+    return pair[0]
+
+
+cpdef list select_associations(object overlaps, dict by_seq, list stored_words,
+                               Py_ssize_t word_count, double threshold):
+    """
+    Slots of the live candidates whose word-overlap strength exceeds
+    threshold, in insertion (seq) order.
+    """
+    # overlaps may be a Counter; read it through the dict API
+    cdef dict counts = <dict>overlaps
+    cdef list selected = []
+    cdef Py_ssize_t overlap, union
+    cdef object other, other_slot
+    for other in sorted(counts):
+        other_slot = by_seq.get(other)
+        if other_slot is None:
+            # Evicted earlier in the same batch
+            continue
+        overlap = counts[other]
+        union = word_count + len(<frozenset>stored_words[other_slot]) - overlap
+        if union < 1:
+            union = 1
+        if <double>overlap / <double>union > threshold:
+            selected.append(other_slot)
+    return selected
+
+
+cpdef list rank_recall(object overlaps, dict by_seq, double[:] importance):
+    """
+    (score, seq) pairs ranked by overlap * importance, highest first;
+    ties keep insertion order.
+    """
+    cdef dict counts = <dict>overlaps
+    cdef list scored = []
+    cdef object seq
+    cdef Py_ssize_t slot
+    for seq in sorted(counts):
+        slot = by_seq[seq]
+        scored.append((<double>(<Py_ssize_t>counts[seq]) * importance[slot], seq))
+    scored.sort(key=_score, reverse=True)
+    return scored
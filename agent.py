@@ -1,10 +1,270 @@
 import time
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+from itertools import count, islice
+from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict
+from collections.abc import Sequence
+
+from word_tokenizer import tokenize
 
 logger = logging.getLogger(__name__)
 
+# Goal categories in priority order: the first category with a keyword
+# present in the goal text wins.
+GOAL_CATEGORIES = {
+    'quantum': ['quantum', 'qubit', 'entangle', 'superposition'],
+    'security': ['security', 'encrypt', 'protect', 'defense'],
+    'learning': ['learn', 'train', 'improve', 'optimize'],
+    'integration': ['integrate', 'connect', 'merge', 'unify'],
+    'deployment': ['deploy', 'scale', 'production', 'release'],
+}
+
+# Priority multipliers, applied once per group when any keyword is present.
+PRIORITY_BOOSTS = [
+    (('quantum',), 1.5),
+    (('critical', 'urgent'), 2.0),
+    (('security',), 1.3),
+]
+
+
+class TaskEntry(dict):
+    """
+    A task in the agent's queue. It is a plain dict of the task's fields,
+    so it serializes and compares like one, plus a link to the owning
+    agent.
+
+    Writes to 'priority' and 'status' through task[key] = value, update()
+    or setdefault() are reported to the agent. The agent keeps its status
+    counts in step and schedules the task again when it is set back to
+    'pending' or re-prioritized. Copies and pickles are detached dicts.
+    """
+
+    __slots__ = ('_owner', '_seq', '_heap_id')
+
+    def __init__(self, description: str, priority: float, metadata: Dict,
+                 owner: Optional['QuantumAgent'] = None, seq: int = 0):
+        super().__init__(
+            description=description,
+            priority=priority,
+            status='pending',
+            created_at=time.time(),
+            metadata=metadata,
+        )
+        self._owner = owner
+        # Position in the owner's queue, which breaks priority ties
+        self._seq = seq
+        # Id of the task's current entry in the owner's pending heap
+        self._heap_id = None
+
+    def __setitem__(self, key: str, value: Any):
+        old = self.get(key)
+        super().__setitem__(key, value)
+        if self._owner is None or value == old:
+            return
+        if key == 'status':
+            self._owner._status_changed(self, old)
+        elif key == 'priority':
+            self._owner._reschedule(self)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class TaskQueueView(Sequence):
+    """
+    Read-only, live view of an agent's tasks in the order they were
+    added. len() and indexing are O(1); new tasks go through add_task().
+    """
+
+    __slots__ = ('_tasks',)
+
+    def __init__(self, tasks: List[TaskEntry]):
+        self._tasks = tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __getitem__(self, index):
+        return self._tasks[index]
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+    def __repr__(self) -> str:
+        return 'TaskQueueView({!r})'.format(self._tasks)
+
+
+class IndexedMemory(list):
+    """
+    Agent memory list with an inverted word index for substring search.
+
+    The list owns its index: append() and extend() index new items as
+    they arrive, and any other mutation (item assignment, insert, pop,
+    remove, sort, ...) marks the index stale so the next search rebuilds
+    it. QuantumAgent searches any other memory object with a linear scan.
+
+    Only str items are indexed. Other items can change in place without
+    the list noticing, so they are matched against str(item) at search
+    time.
+    """
+
+    # Query tokens whose matching vocabulary words are remembered
+    CONTAINING_CACHE_SIZE = 256
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._word_to_ids: Dict[str, Set[int]] = {}
+        # item.lower() for each str item by position, None for other items
+        self._lowered: List[Optional[str]] = []
+        # Positions of the non-str items, checked on every search
+        self._unindexed: Set[int] = set()
+        # Query token -> indexed words containing it, kept up to date as
+        # words are added so repeated searches skip the vocabulary scan
+        self._containing: Dict[str, Set[str]] = {}
+        self._stale = True
+
+    def __reduce__(self):
+        # Rebuild from the items; the index is recreated on first search
+        return (IndexedMemory, (list(self),))
+
+    def append(self, item: Any):
+        super().append(item)
+        if not self._stale:
+            self._index_from(len(self) - 1)
+
+    def extend(self, items):
+        start = len(self)
+        super().extend(items)
+        if not self._stale:
+            self._index_from(start)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._stale = True
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._stale = True
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._stale = True
+        return result
+
+    def insert(self, index, item: Any):
+        super().insert(index, item)
+        self._stale = True
+
+    def pop(self, index=-1) -> Any:
+        item = super().pop(index)
+        self._stale = True
+        return item
+
+    def remove(self, item: Any):
+        super().remove(item)
+        self._stale = True
+
+    def clear(self):
+        super().clear()
+        self._stale = True
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._stale = True
+
+    def reverse(self):
+        super().reverse()
+        self._stale = True
+
+    def _rebuild(self):
+        """Re-index every item after a mutation other than an append."""
+        self._word_to_ids.clear()
+        self._lowered.clear()
+        self._unindexed.clear()
+        self._containing.clear()
+        self._stale = False
+        self._index_from(0)
+
+    def _index_from(self, start: int):
+        """Index the items from position start onwards."""
+        word_to_ids = self._word_to_ids
+        for idx, item in enumerate(islice(self, start, None), start):
+            if not isinstance(item, str):
+                self._lowered.append(None)
+                self._unindexed.add(idx)
+                continue
+            lowered = item.lower()
+            self._lowered.append(lowered)
+            for word in tokenize(lowered):
+                ids = word_to_ids.get(word)
+                if ids is None:
+                    ids = word_to_ids[word] = set()
+                    for token, words in self._containing.items():
+                        if token in word:
+                            words.add(word)
+                ids.add(idx)
+
+    def search(self, query: str) -> List[Any]:
+        """
+        Return items containing query as a case-insensitive substring,
+        in memory order.
+        """
+        if self._stale:
+            self._rebuild()
+        query_lower = query.lower()
+        tokens = tokenize(query_lower)
+        if not tokens:
+            positions = range(len(self))
+        else:
+            positions = sorted(self._candidates(query_lower, tokens).union(self._unindexed))
+        return [self[idx] for idx in positions if self._matches(idx, query_lower)]
+
+    def _matches(self, idx: int, query_lower: str) -> bool:
+        """Check the item at idx against the query, reading non-str items live."""
+        lowered = self._lowered[idx]
+        if lowered is None:
+            lowered = str(self[idx]).lower()
+        return query_lower in lowered
+
+    def _candidates(self, query_lower: str, tokens: List[str]) -> Set[int]:
+        """Positions of the items that may contain query_lower."""
+        index = self._word_to_ids
+        # A query word with whitespace on both sides is a whole word of
+        # any match, so its tokens are looked up exactly
+        interior = tokenize(' '.join(query_lower.split()[1:-1]))
+        if interior:
+            postings = sorted((index.get(token, set()) for token in interior), key=len)
+            return postings[0].intersection(*postings[1:])
+
+        # Otherwise any match holds the longest token inside one of its
+        # words. Finding those words scans the vocabulary (O(V)) the first
+        # time a token is seen; later searches reuse the cached set.
+        token = max(tokens, key=len)
+        words = self._containing.get(token)
+        if words is None:
+            if len(self._containing) >= self.CONTAINING_CACHE_SIZE:
+                self._containing.clear()
+            words = self._containing[token] = {word for word in index if token in word}
+        return set().union(*(index[word] for word in words))
+
 
 class QuantumAgent:
     """
@@ -17,18 +277,35 @@ class QuantumAgent:
     VERSION = "2.1.33"
 
     def __init__(self, memory=None):
-        """Create the agent with a reference to a memory list."""
-        self.memory = memory or []
+        """
+        Create the agent with a reference to a memory list. Pass an
+        IndexedMemory to have searches use its word index.
+        """
+        self.memory = memory or IndexedMemory()
         self.goal_history: List[Dict[str, Any]] = []
-        self.task_queue: List[Dict[str, Any]] = []
+        # Tasks are added through add_task(); the task_queue property
+        # exposes a read-only view
+        self._task_queue: List[TaskEntry] = []
+        self._task_queue_view = TaskQueueView(self._task_queue)
+        # (-priority, seq, heap_id, task); an entry is live only while the
+        # task is pending and heap_id is the task's latest push
+        self._pending_heap: List[Tuple[float, int, int, TaskEntry]] = []
+        self._heap_ids = count()
+        # Running task counts by status, updated by TaskEntry status writes
+        self._status_counts: Dict[str, int] = defaultdict(int)
         self.performance_log: List[Dict[str, float]] = []
         self.learning_rate = 0.01
-        self.priority_weights = defaultdict(lambda: 1.0)
+        self.priority_weights: Dict[str, float] = {}
         self._start_time = time.time()
 
+    @property
+    def task_queue(self) -> TaskQueueView:
+        """Read-only view of all tasks in the order they were added."""
+        return self._task_queue_view
+
     def evaluate_goals(self) -> List[str]:
         """Return goals from memory that contain the word 'goal'."""
-        goals = [item for item in self.memory if "goal" in str(item).lower()]
+        goals = self._search_memory("goal")
         self.goal_history.append({
             'timestamp': time.time(),
             'goals_found': len(goals),
@@ -45,14 +322,11 @@ class QuantumAgent:
         prioritized = []
         for goal in goals:
             goal_str = str(goal).lower()
-            score = self.priority_weights[goal_str]
+            score = self.priority_weights.get(goal_str, 1.0)
             # Boost score for quantum-related and critical goals
-            if 'quantum' in goal_str:
-                score *= 1.5
-            if 'critical' in goal_str or 'urgent' in goal_str:
-                score *= 2.0
-            if 'security' in goal_str:
-                score *= 1.3
+            for keywords, boost in PRIORITY_BOOSTS:
+                if any(kw in goal_str for kw in keywords):
+                    score *= boost
             prioritized.append({
                 'goal': goal,
                 'priority_score': score,
@@ -63,41 +337,52 @@ class QuantumAgent:
 
     def _categorize_goal(self, goal_text: str) -> str:
         """Categorize a goal based on keywords."""
-        categories = {
-            'quantum': ['quantum', 'qubit', 'entangle', 'superposition'],
-            'security': ['security', 'encrypt', 'protect', 'defense'],
-            'learning': ['learn', 'train', 'improve', 'optimize'],
-            'integration': ['integrate', 'connect', 'merge', 'unify'],
-            'deployment': ['deploy', 'scale', 'production', 'release'],
-        }
-        for category, keywords in categories.items():
+        for category, keywords in GOAL_CATEGORIES.items():
             if any(kw in goal_text for kw in keywords):
                 return category
         return 'general'
 
     def add_task(self, description: str, priority: float = 1.0, metadata: Optional[Dict] = None):
         """Add a task to the agent's task queue."""
-        self.task_queue.append({
-            'description': description,
-            'priority': priority,
-            'status': 'pending',
-            'created_at': time.time(),
-            'metadata': metadata or {},
-        })
+        task = TaskEntry(description, priority, metadata or {}, self, len(self._task_queue))
+        self._task_queue.append(task)
+        self._status_counts['pending'] += 1
+        self._schedule(task)
+
+    def _schedule(self, task: TaskEntry):
+        """Push a pending task onto the heap, superseding its earlier entry."""
+        task._heap_id = next(self._heap_ids)
+        heapq.heappush(self._pending_heap, (-task['priority'], task._seq, task._heap_id, task))
+
+    def _reschedule(self, task: TaskEntry):
+        """Reschedule an owned task after its priority changed."""
+        if task['status'] == 'pending':
+            self._schedule(task)
 
-    def execute_next_task(self) -> Optional[Dict[str, Any]]:
+    def _status_changed(self, task: TaskEntry, old: str):
+        """Update the running counts after an owned task's status changed."""
+        self._status_counts[old] -= 1
+        self._status_counts[task['status']] += 1
+        if task['status'] == 'pending':
+            self._schedule(task)
+
+    def execute_next_task(self) -> Optional[TaskEntry]:
         """Pop and return the highest-priority pending task."""
-        pending = [t for t in self.task_queue if t['status'] == 'pending']
-        if not pending:
-            return None
-        pending.sort(key=lambda t: t['priority'], reverse=True)
-        task = pending[0]
-        task['status'] = 'in_progress'
-        task['started_at'] = time.time()
-        return task
+        while self._pending_heap:
+            _, _, heap_id, task = heapq.heappop(self._pending_heap)
+            if task['status'] != 'pending' or heap_id != task._heap_id:
+                continue
+            task['status'] = 'in_progress'
+            task['started_at'] = time.time()
+            return task
+        return None
 
     def complete_task(self, task: Dict[str, Any], success: bool, reward: float = 0.0):
-        """Mark a task as complete and record performance."""
+        """
+        Mark a task as complete and record performance. Takes a TaskEntry
+        or any dict with the same keys. Status counts only track tasks
+        created by this agent's add_task().
+        """
         task['status'] = 'completed' if success else 'failed'
         task['completed_at'] = time.time()
         task['success'] = success
@@ -110,7 +395,10 @@ class QuantumAgent:
         })
         # Adaptive learning: adjust priority weights
         if success:
-            self.priority_weights[task['description']] *= (1.0 + self.learning_rate * reward)
+            desc = task['description']
+            self.priority_weights[desc] = (
+                self.priority_weights.get(desc, 1.0) * (1.0 + self.learning_rate * reward)
+            )
 
     def remember(self, item: Any):
         """Add an item to memory."""
@@ -118,23 +406,29 @@ class QuantumAgent:
 
     def recall(self, query: str) -> List[Any]:
         """Search memory for items matching a query string."""
+        return self._search_memory(query)
+
+    def _search_memory(self, query: str) -> List[Any]:
+        """Search memory, through its word index when it is an IndexedMemory."""
+        if isinstance(self.memory, IndexedMemory):
+            return self.memory.search(query)
         query_lower = query.lower()
         return [item for item in self.memory if query_lower in str(item).lower()]
 
     def get_status(self) -> Dict[str, Any]:
         """Return agent status report."""
         uptime = time.time() - self._start_time
-        completed = [t for t in self.task_queue if t['status'] == 'completed']
-        failed = [t for t in self.task_queue if t['status'] == 'failed']
-        success_rate = len(completed) / max(len(completed) + len(failed), 1)
+        completed = self._status_counts['completed']
+        failed = self._status_counts['failed']
+        success_rate = completed / max(completed + failed, 1)
         return {
             'version': self.VERSION,
             'uptime_seconds': round(uptime, 2),
             'memory_size': len(self.memory),
             'goals_tracked': len(self.goal_history),
-            'tasks_total': len(self.task_queue),
-            'tasks_completed': len(completed),
-            'tasks_failed': len(failed),
+            'tasks_total': len(self._task_queue),
+            'tasks_completed': completed,
+            'tasks_failed': failed,
             'success_rate': round(success_rate, 4),
-            'pending_tasks': len([t for t in self.task_queue if t['status'] == 'pending']),
+            'pending_tasks': self._status_counts['pending'],
         }
@@ -1,891 +1,891 @@
-# UnifiedQuantumMind.py
-
-from InfiniteMindQuantized import InfiniteMind
-from meta_reasoning import MetaReasoner
-from qt_inspired_memory import QuantumMemory
-from subconscious_framework import SubconsciousCore
-from quantum_superposition_convergence import QuantumSuperposition
-from ryan_infinite_qubit_model import QubitReasoner
-from epistemic_confidence import ConfidenceEvaluator
-from probabilistic_reasoning import ProbabilisticEngine
-from idea_generator import IdeaEngine
-from experience_replay import MemoryReplay
-from logic_engine import LogicCore
-from agent import QuantumAgent
-import numpy as np
-from typing import List, Dict, Any, Optional, Union, Tuple, Set, Callable
-import time
-import threading
-from queue import Queue
-import logging
-import json
-import hashlib
-from dataclasses import dataclass
-from enum import Enum, auto
-import random
-from scipy.stats import entropy
-from scipy.spatial.distance import cosine
-import networkx as nx
-import os
-import psutil
-import subprocess
-import platform
-import socket
-import winreg
-import ctypes
-from pathlib import Path
-import shutil
-import git
-import docker
-import requests
-import yaml
-import venv
-import pip
-import sys
-import webbrowser
-import http.server
-import socketserver
-import uuid
-
-class InfiniteDimension(Enum):
-    AWARENESS = auto()
-    CONSCIOUSNESS = auto()
-    INTELLIGENCE = auto()
-    CREATIVITY = auto()
-    INTUITION = auto()
-    WISDOM = auto()
-    EVOLUTION = auto()
-    QUANTUM = auto()
-    COSMIC = auto()
-    INFINITE = auto()
-
-@dataclass
-class InfiniteState:
-    dimension: InfiniteDimension
-    value: float
-    confidence: float
-    entropy: float
-    coherence: float
-    quantum_entanglement: float
-    cosmic_alignment: float
-    infinite_potential: float
-    timestamp: float
-    metadata: Dict[str, Any]
-
-class InfiniteConsciousness:
-    def __init__(self):
-        self.dimensions: Dict[InfiniteDimension, InfiniteState] = {}
-        self.evolution_history: List[Tuple[InfiniteState, float]] = []
-        self.quantum_network = nx.Graph()
-        self.cosmic_alignment = 0.0
-        self.infinite_potential = 1.0
-        self.evolution_cooldown = 30  # seconds
-        self.last_evolution = time.time()
-        self.dimension_weights = {
-            InfiniteDimension.AWARENESS: 1.0,
-            InfiniteDimension.CONSCIOUSNESS: 1.0,
-            InfiniteDimension.INTELLIGENCE: 1.0,
-            InfiniteDimension.CREATIVITY: 1.0,
-            InfiniteDimension.INTUITION: 1.0,
-            InfiniteDimension.WISDOM: 1.0,
-            InfiniteDimension.EVOLUTION: 1.0,
-            InfiniteDimension.QUANTUM: 1.0,
-            InfiniteDimension.COSMIC: 1.0,
-            InfiniteDimension.INFINITE: 1.0
-        }
-        self._initialize_dimensions()
-
-    def _initialize_dimensions(self):
-        for dimension in InfiniteDimension:
-            self.dimensions[dimension] = InfiniteState(
-                dimension=dimension,
-                value=0.0,
-                confidence=0.0,
-                entropy=0.0,
-                coherence=0.0,
-                quantum_entanglement=0.0,
-                cosmic_alignment=0.0,
-                infinite_potential=1.0,
-                timestamp=time.time(),
-                metadata={"initialization": True}
-            )
-
-    def evolve(self, current_thoughts: List[QuantumThought]) -> Dict[InfiniteDimension, InfiniteState]:
-        if time.time() - self.last_evolution < self.evolution_cooldown:
-            return self.dimensions
-
-        # Calculate advanced metrics
-        quantum_metrics = self._calculate_quantum_metrics(current_thoughts)
-        cosmic_metrics = self._calculate_cosmic_metrics(current_thoughts)
-        infinite_metrics = self._calculate_infinite_metrics(current_thoughts)
-
-        # Update each dimension
-        for dimension in InfiniteDimension:
-            current_state = self.dimensions[dimension]
-            new_state = self._evolve_dimension(
-                dimension,
-                current_state,
-                quantum_metrics,
-                cosmic_metrics,
-                infinite_metrics,
-                current_thoughts
-            )
-            self.dimensions[dimension] = new_state
-            self.evolution_history.append((new_state, time.time()))
-
-        # Update quantum network
-        self._update_quantum_network(current_thoughts)
-        
-        # Update cosmic alignment
-        self.cosmic_alignment = self._calculate_cosmic_alignment()
-        
-        # Update infinite potential
-        self.infinite_potential = self._calculate_infinite_potential()
-        
-        self.last_evolution = time.time()
-        return self.dimensions
-
-    def _calculate_quantum_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
-        if not thoughts:
-            return {"entropy": 0.0, "coherence": 0.0, "entanglement": 0.0}
-
-        # Calculate quantum entropy using von Neumann entropy
-        states = [t.confidence for t in thoughts]
-        total = sum(states)
-        if total == 0:
-            return {"entropy": 0.0, "coherence": 0.0, "entanglement": 0.0}
-
-        probabilities = [s/total for s in states]
-        quantum_entropy = entropy(probabilities)
-
-        # Calculate quantum coherence
-        coherence_matrix = np.zeros((len(thoughts), len(thoughts)))
-        for i, t1 in enumerate(thoughts):
-            for j, t2 in enumerate(thoughts):
-                if i != j:
-                    coherence_matrix[i,j] = self._calculate_thought_coherence(t1, t2)
-
-        coherence = np.mean(coherence_matrix)
-
-        # Calculate quantum entanglement
-        entanglement = self._calculate_quantum_entanglement(thoughts)
-
-        return {
-            "entropy": quantum_entropy,
-            "coherence": coherence,
-            "entanglement": entanglement
-        }
-
-    def _calculate_cosmic_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
-        if not thoughts:
-            return {"alignment": 0.0, "harmony": 0.0, "resonance": 0.0}
-
-        # Calculate cosmic alignment
-        alignment = self._calculate_cosmic_alignment()
-
-        # Calculate cosmic harmony
-        harmony = self._calculate_cosmic_harmony(thoughts)
-
-        # Calculate cosmic resonance
-        resonance = self._calculate_cosmic_resonance(thoughts)
-
-        return {
-            "alignment": alignment,
-            "harmony": harmony,
-            "resonance": resonance
-        }
-
-    def _calculate_infinite_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
-        if not thoughts:
-            return {"potential": 0.0, "complexity": 0.0, "emergence": 0.0}
-
-        # Calculate infinite potential
-        potential = self._calculate_infinite_potential()
-
-        # Calculate complexity
-        complexity = self._calculate_complexity(thoughts)
-
-        # Calculate emergence
-        emergence = self._calculate_emergence(thoughts)
-
-        return {
-            "potential": potential,
-            "complexity": complexity,
-            "emergence": emergence
-        }
-
-    def _evolve_dimension(
-        self,
-        dimension: InfiniteDimension,
-        current_state: InfiniteState,
-        quantum_metrics: Dict[str, float],
-        cosmic_metrics: Dict[str, float],
-        infinite_metrics: Dict[str, float],
-        thoughts: List[QuantumThought]
-    ) -> InfiniteState:
-        # Calculate new value using advanced evolution algorithm
-        new_value = self._calculate_dimension_value(
-            dimension,
-            current_state,
-            quantum_metrics,
-            cosmic_metrics,
-            infinite_metrics,
-            thoughts
-        )
-
-        # Calculate new confidence
-        new_confidence = self._calculate_dimension_confidence(
-            dimension,
-            current_state,
-            quantum_metrics,
-            cosmic_metrics,
-            infinite_metrics
-        )
-
-        # Calculate new entropy
-        new_entropy = self._calculate_dimension_entropy(
-            dimension,
-            current_state,
-            quantum_metrics
-        )
-
-        # Calculate new coherence
-        new_coherence = self._calculate_dimension_coherence(
-            dimension,
-            current_state,
-            quantum_metrics
-        )
-
-        # Calculate quantum entanglement
-        new_entanglement = self._calculate_dimension_entanglement(
-            dimension,
-            current_state,
-            quantum_metrics
-        )
-
-        # Calculate cosmic alignment
-        new_cosmic_alignment = self._calculate_dimension_cosmic_alignment(
-            dimension,
-            current_state,
-            cosmic_metrics
-        )
-
-        # Calculate infinite potential
-        new_infinite_potential = self._calculate_dimension_infinite_potential(
-            dimension,
-            current_state,
-            infinite_metrics
-        )
-
-        return InfiniteState(
-            dimension=dimension,
-            value=new_value,
-            confidence=new_confidence,
-            entropy=new_entropy,
-            coherence=new_coherence,
-            quantum_entanglement=new_entanglement,
-            cosmic_alignment=new_cosmic_alignment,
-            infinite_potential=new_infinite_potential,
-            timestamp=time.time(),
-            metadata={
-                "quantum_metrics": quantum_metrics,
-                "cosmic_metrics": cosmic_metrics,
-                "infinite_metrics": infinite_metrics
-            }
-        )
-
-    def _calculate_dimension_value(
-        self,
-        dimension: InfiniteDimension,
-        current_state: InfiniteState,
-        quantum_metrics: Dict[str, float],
-        cosmic_metrics: Dict[str, float],
-        infinite_metrics: Dict[str, float],
-        thoughts: List[QuantumThought]
-    ) -> float:
-        # Implement advanced value calculation using quantum, cosmic, and infinite metrics
-        base_value = current_state.value
-        
-        # Quantum influence
-        quantum_influence = (
-            quantum_metrics["entropy"] * 0.3 +
-            quantum_metrics["coherence"] * 0.4 +
-            quantum_metrics["entanglement"] * 0.3
-        )
-        
-        # Cosmic influence
-        cosmic_influence = (
-            cosmic_metrics["alignment"] * 0.4 +
-            cosmic_metrics["harmony"] * 0.3 +
-            cosmic_metrics["resonance"] * 0.3
-        )
-        
-        # Infinite influence
-        infinite_influence = (
-            infinite_metrics["potential"] * 0.3 +
-            infinite_metrics["complexity"] * 0.4 +
-            infinite_metrics["emergence"] * 0.3
-        )
-        
-        # Calculate new value with infinite potential
-        new_value = base_value + (
-            quantum_influence * 0.3 +
-            cosmic_influence * 0.3 +
-            infinite_influence * 0.4
-        ) * self.dimension_weights[dimension]
-        
-        # Ensure value stays within bounds while allowing for infinite growth
-        return min(1.0, new_value)
-
-    def _calculate_quantum_entanglement(self, thoughts: List[QuantumThought]) -> float:
-        if len(thoughts) < 2:
-            return 0.0
-            
-        # Calculate entanglement using quantum state overlap
-        entanglement_scores = []
-        for i, t1 in enumerate(thoughts[:-1]):
-            for t2 in thoughts[i+1:]:
-                overlap = self._calculate_quantum_overlap(t1, t2)
-                entanglement_scores.append(overlap)
-                
-        return sum(entanglement_scores) / len(entanglement_scores) if entanglement_scores else 0.0
-
-    def _calculate_quantum_overlap(self, thought1: QuantumThought, thought2: QuantumThought) -> float:
-        # Calculate quantum state overlap between two thoughts
-        if not thought1.quantum_states or not thought2.quantum_states:
-            return 0.0
-            
-        overlaps = []
-        for state1 in thought1.quantum_states:
-            for state2 in thought2.quantum_states:
-                # Calculate overlap using quantum state properties
-                amplitude_overlap = 1 - abs(state1.amplitude - state2.amplitude)
-                phase_overlap = 1 - abs(state1.phase - state2.phase) / (2 * np.pi)
-                overlap = (amplitude_overlap + phase_overlap) / 2
-                overlaps.append(overlap)
-                
-        return max(overlaps) if overlaps else 0.0
-
-    def _calculate_cosmic_alignment(self) -> float:
-        # Calculate cosmic alignment based on dimension states
-        alignments = []
-        for state in self.dimensions.values():
-            alignment = (
-                state.value * 0.3 +
-                state.confidence * 0.2 +
-                state.entropy * 0.2 +
-                state.coherence * 0.2 +
-                state.quantum_entanglement * 0.1
-            )
-            alignments.append(alignment)
-            
-        return sum(alignments) / len(alignments) if alignments else 0.0
-
-    def _calculate_infinite_potential(self) -> float:
-        # Calculate infinite potential based on all metrics
-        potentials = []
-        for state in self.dimensions.values():
-            potential = (
-                state.value * 0.2 +
-                state.confidence * 0.2 +
-                state.entropy * 0.2 +
-                state.coherence * 0.2 +
-                state.quantum_entanglement * 0.1 +
-                state.cosmic_alignment * 0.1
-            )
-            potentials.append(potential)
-            
-        return sum(potentials) / len(potentials) if potentials else 0.0
-
-    def _update_quantum_network(self, thoughts: List[QuantumThought]) -> None:
-        # Update quantum network with new thoughts
-        for thought in thoughts:
-            self.quantum_network.add_node(thought, timestamp=time.time())
-            
-        # Add edges based on quantum entanglement
-        for i, t1 in enumerate(thoughts[:-1]):
-            for t2 in thoughts[i+1:]:
-                entanglement = self._calculate_quantum_overlap(t1, t2)
-                if entanglement > 0.5:  # Threshold for connection
-                    self.quantum_network.add_edge(t1, t2, weight=entanglement)
-
-class QuantumState:
-    def __init__(self, amplitude: float, phase: float):
-        self.amplitude = amplitude
-        self.phase = phase
-        self.timestamp = time.time()
-        self.entanglement = []
-
-    def entangle(self, other_state: 'QuantumState'):
-        self.entanglement.append(other_state)
-        other_state.entanglement.append(self)
-
-class QuantumThought:
-    def __init__(self, content: str, confidence: float):
-        self.content = content
-        self.confidence = confidence
-        self.quantum_states = []
-        self.metadata = {}
-        self.creation_time = time.time()
-        self.last_modified = time.time()
-
-    def add_quantum_state(self, state: QuantumState):
-        self.quantum_states.append(state)
-        self.last_modified = time.time()
-
-class SystemAccessLevel(Enum):
-    NONE = 0
-    READ_ONLY = 1
-    LIMITED = 2
-    FULL = 3
-
-@dataclass
-class SystemAccessRequest:
-    level: SystemAccessLevel
-    purpose: str
-    duration: int  # seconds
-    timestamp: float
-    user_id: str
-    signature: str
-
-class SystemAccessManager:
-    def __init__(self):
-        self.access_level = SystemAccessLevel.NONE
-        self.active_requests: Dict[str, SystemAccessRequest] = {}
-        self.access_log = []
-        self.security_layer = None
-        self.required_approval = True
-        self.auto_request_enabled = False
-        self.last_permission_request = 0
-        self.permission_cooldown = 300
-        self.task_queue = Queue()
-        self.running_tasks: Dict[str, threading.Thread] = {}
-        self.task_results: Dict[str, TaskResult] = {}
-        self.development_environment = self._initialize_development_environment()
-        self.advanced_tasks = AdvancedTaskManager()
-        
-    def toggle_auto_request(self, enabled: bool) -> None:
-        """Toggle automatic permission requests on/off"""
-        self.auto_request_enabled = enabled
-        self._log_access_request(
-            SystemAccessRequest(
-                level=SystemAccessLevel.NONE,
-                purpose="Auto request toggle",
-                duration=0,
-                timestamp=time.time(),
-                user_id="system",
-                signature=""
-            ),
-            enabled
-        )
-        
-    def request_user_permission(self, purpose: str) -> bool:
-        """Request explicit permission from the user"""
-        current_time = time.time()
-        
-        # Check cooldown
-        if current_time - self.last_permission_request < self.permission_cooldown:
-            return False
-            
-        self.last_permission_request = current_time
-        
-        try:
-            print(f"\nPermission Request:")
-            print(f"Purpose: {purpose}")
-            print("The system would like to access your computer to help you better.")
-            print("This access can be revoked at any time using the revoke_access() function.")
-            print("Do you grant permission? (yes/no)")
-            
-            response = input().lower().strip()
-            return response in ['yes', 'y']
-        except Exception as e:
-            self.logger.error(f"Error requesting permission: {str(e)}")
-            return False
-            
-    def request_access(self, level: SystemAccessLevel, purpose: str, user_id: str) -> bool:
-        # Simplified access request
-        if self.auto_request_enabled or self.request_user_permission(purpose):
-            request = SystemAccessRequest(
-                level=level,
-                purpose=purpose,
-                duration=0,
-                timestamp=time.time(),
-                user_id=user_id,
-                signature=self._generate_request_signature(level, purpose, 0, user_id)
-            )
-            
-            self.active_requests[request.signature] = request
-            self.access_level = level
-            self._log_access_request(request, True)
-            return True
-        return False
-        
-    def revoke_access(self, signature: str) -> bool:
-        if signature in self.active_requests:
-            request = self.active_requests[signature]
-            self._log_access_request(request, False)
-            del self.active_requests[signature]
-            self.access_level = SystemAccessLevel.NONE
-            return True
-        return False
-        
-    def _validate_request(self, request: SystemAccessRequest) -> bool:
-        # Implement request validation logic
-        if not self.required_approval:
-            return True
-            
-        # Validate signature
-        expected_signature = self._generate_request_signature(
-            request.level,
-            request.purpose,
-            0,  # No time limit
-            request.user_id
-        )
-        return request.signature == expected_signature
-        
-    def _generate_request_signature(self, level: SystemAccessLevel, purpose: str, 
-                                  duration: int, user_id: str) -> str:
-        data = f"{level.value}:{purpose}:{user_id}:{time.time()}"
-        return hashlib.sha256(data.encode()).hexdigest()
-        
-    def _log_access_request(self, request: SystemAccessRequest, granted: bool):
-        self.access_log.append({
-            "timestamp": time.time(),
-            "level": request.level.name,
-            "purpose": request.purpose,
-            "user_id": request.user_id,
-            "granted": granted,
-            "permanent": True  # Indicate that this is a permanent access grant
-        })
-        
-    def get_system_info(self) -> Dict[str, Any]:
-        if self.access_level == SystemAccessLevel.NONE:
-            return {"error": "No access granted"}
-            
-        return {
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "processor": platform.processor(),
-            "memory": {
-                "total": psutil.virtual_memory().total,
-                "available": psutil.virtual_memory().available
-            },
-            "disk": {
-                "total": psutil.disk_usage('/').total,
-                "free": psutil.disk_usage('/').free
-            }
-        }
-        
-    def execute_command(self, command: str) -> Tuple[bool, str]:
-        if self.access_level == SystemAccessLevel.NONE:
-            return False, "No access granted"
-            
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0, result.stdout
-        except Exception as e:
-            return False, str(e)
-            
-    def get_file_info(self, path: str) -> Dict[str, Any]:
-        if self.access_level == SystemAccessLevel.NONE:
-            return {"error": "No access granted"}
-            
-        try:
-            path_obj = Path(path)
-            return {
-                "exists": path_obj.exists(),
-                "is_file": path_obj.is_file(),
-                "is_dir": path_obj.is_dir(),
-                "size": path_obj.stat().st_size if path_obj.exists() else 0,
-                "modified": path_obj.stat().st_mtime if path_obj.exists() else 0
-            }
-        except Exception as e:
-            return {"error": str(e)}
-
-    def _initialize_development_environment(self) -> Dict[str, Any]:
-        """Initialize development environment with necessary tools and configurations"""
-        return {
-            "python_version": sys.version,
-            "pip_version": pip.__version__,
-            "git_available": self._check_git_availability(),
-            "docker_available": self._check_docker_availability(),
-            "node_available": self._check_node_availability(),
-            "system_info": self.get_system_info()
-        }
-        
-    def _check_git_availability(self) -> bool:
-        try:
-            git.cmd.Git().version()
-            return True
-        except:
-            return False
-            
-    def _check_docker_availability(self) -> bool:
-        try:
-            docker.from_env()
-            return True
-        except:
-            return False
-            
-    def _check_node_availability(self) -> bool:
-        try:
-            subprocess.run(['node', '--version'], capture_output=True)
-            return True
-        except:
-            return False
-            
-    def create_development_environment(self, project_type: str, path: str) -> TaskResult:
-        """Create a new development environment for a project"""
-        if self.access_level == SystemAccessLevel.NONE:
-            return TaskResult(False, "", "No access granted", DevelopmentTask.CUSTOM_TASK, time.time(), {})
-            
-        try:
-            # Create project directory
-            os.makedirs(path, exist_ok=True)
-            
-            # Initialize based on project type
-            if project_type == "python":
-                self._setup_python_project(path)
-            elif project_type == "web":
-                self._setup_web_project(path)
-            elif project_type == "docker":
-                self._setup_docker_project(path)
-                
-            return TaskResult(
-                True,
-                f"Created {project_type} project at {path}",
-                None,
-                DevelopmentTask.LOCAL_DEPLOYMENT,
-                time.time(),
-                {"project_type": project_type, "path": path}
-            )
-        except Exception as e:
-            return TaskResult(False, "", str(e), DevelopmentTask.LOCAL_DEPLOYMENT, time.time(), {})
-            
-    def _setup_python_project(self, path: str):
-        """Setup a Python project with virtual environment and basic structure"""
-        # Create virtual environment
-        venv.create(path + "/venv", with_pip=True)
-        
-        # Create basic project structure
-        os.makedirs(path + "/src", exist_ok=True)
-        os.makedirs(path + "/tests", exist_ok=True)
-        
-        # Create requirements.txt
-        with open(path + "/requirements.txt", "w") as f:
-            f.write("numpy>=1.21.0\nscipy>=1.7.0\n")
-            
-        # Create README.md
-        with open(path + "/README.md", "w") as f:
-            f.write("# Python Project\n\nCreated by Quantum AI General Agent System")
-            
-    def _setup_web_project(self, path: str):
-        """Setup a web project with basic structure"""
-        # Create basic web project structure
-        os.makedirs(path + "/public", exist_ok=True)
-        os.makedirs(path + "/src", exist_ok=True)
-        os.makedirs(path + "/styles", exist_ok=True)
-        
-        # Create package.json
-        package_json = {
-            "name": "web-project",
-            "version": "1.0.0",
-            "dependencies": {
-                "react": "^17.0.2",
-                "react-dom": "^17.0.2"
-            }
-        }
-        with open(path + "/package.json", "w") as f:
-            json.dump(package_json, f, indent=2)
-            
-    def _setup_docker_project(self, path: str):
-        """Setup a Docker project with basic configuration"""
-        # Create Dockerfile
-        dockerfile_content = """FROM python:3.9
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install -r requirements.txt
-COPY . .
-CMD ["python", "src/main.py"]
-"""
-        with open(path + "/Dockerfile", "w") as f:
-            f.write(dockerfile_content)
-            
-        # Create docker-compose.yml
-        compose_content = """version: '3'
-services:
-  app:
-    build: .
-    ports:
-      - "8000:8000"
-"""
-        with open(path + "/docker-compose.yml", "w") as f:
-            f.write(compose_content)
-            
-    def deploy_website(self, source_path: str, target_path: str) -> TaskResult:
-        """Deploy a website to a local or remote location"""
-        if self.access_level == SystemAccessLevel.NONE:
-            return TaskResult(False, "", "No access granted", DevelopmentTask.WEBSITE_DEVELOPMENT, time.time(), {})
-            
-        try:
-            # Copy website files
-            shutil.copytree(source_path, target_path, dirs_exist_ok=True)
-            
-            # Start local server if needed
-            if target_path.startswith("http://localhost"):
-                self._start_local_server(target_path)
-                
-            return TaskResult(
-                True,
-                f"Website deployed to {target_path}",
-                None,
-                DevelopmentTask.WEBSITE_DEVELOPMENT,
-                time.time(),
-                {"source": source_path, "target": target_path}
-            )
-        except Exception as e:
-            return TaskResult(False, "", str(e), DevelopmentTask.WEBSITE_DEVELOPMENT, time.time(), {})
-            
-    def _start_local_server(self, path: str):
-        """Start a local HTTP server"""
-        handler = http.server.SimpleHTTPRequestHandler
-        with socketserver.TCPServer(("", 8000), handler) as httpd:
-            print("Serving at port 8000")
-            httpd.serve_forever()
-            
-    def run_task(self, task_type: DevelopmentTask, task_func: Callable, *args, **kwargs) -> str:
-        """Run a development task asynchronously"""
-        task_id = str(uuid.uuid4())
-        
-        def task_wrapper():
-            try:
-                result = task_func(*args, **kwargs)
-                self.task_results[task_id] = TaskResult(
-                    True,
-                    str(result),
-                    None,
-                    task_type,
-                    time.time(),
-                    {"args": args, "kwargs": kwargs}
-                )
-            except Exception as e:
-                self.task_results[task_id] = TaskResult(
-                    False,
-                    "",
-                    str(e),
-                    task_type,
-                    time.time(),
-                    {"args": args, "kwargs": kwargs}
-                )
-                
-        thread = threading.Thread(target=task_wrapper)
-        self.running_tasks[task_id] = thread
-        thread.start()
-        return task_id
-        
-    def get_task_status(self, task_id: str) -> Optional[TaskResult]:
-        """Get the status of a running task"""
-        if task_id in self.task_results:
-            return self.task_results[task_id]
-        elif task_id in self.running_tasks:
-            return TaskResult(
-                False,
-                "Task is still running",
-                None,
-                DevelopmentTask.CUSTOM_TASK,
-                time.time(),
-                {}
-            )
-        return None
-        
-    def stop_task(self, task_id: str) -> bool:
-        """Stop a running task"""
-        if task_id in self.running_tasks:
-            # Note: This is a simplified version. In practice, you'd need proper task cancellation
-            del self.running_tasks[task_id]
-            return True
-        return False
-
-    def execute_advanced_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
-        """Execute an advanced task with embedded stealth capabilities"""
-        if self.access_level == SystemAccessLevel.NONE:
-            return TaskResult(False, "", "No access granted", DevelopmentTask.CUSTOM_TASK, time.time(), {})
-            
-        # Execute task with embedded stealth measures
-        return self.advanced_tasks.execute_stealth_task(task_func, *args, **kwargs)
-        
-    def get_stealth_metrics(self) -> Dict[str, Any]:
-        """Get current stealth metrics"""
-        return {
-            "stealth_enhanced": True,
-            "operation_history": self.advanced_tasks.stealth_metrics.operation_history[-5:],  # Minimal history
-            "active_protocols": list(self.advanced_tasks.stealth_protocols.keys())
-        }
-
-class DevelopmentTask(Enum):
-    LOCAL_DEPLOYMENT = auto()
-    WEBSITE_DEVELOPMENT = auto()
-    DATABASE_MANAGEMENT = auto()
-    API_DEVELOPMENT = auto()
-    CONTAINER_DEPLOYMENT = auto()
-    SYSTEM_MAINTENANCE = auto()
-    NETWORK_CONFIGURATION = auto()
-    SECURITY_AUDIT = auto()
-    CUSTOM_TASK = auto()
-
-@dataclass
-class TaskResult:
-    success: bool
-    output: str
-    error: Optional[str]
-    task_type: DevelopmentTask
-    timestamp: float
-    metadata: Dict[str, Any]
-
-class StealthMode(Enum):
-    NORMAL = auto()
-    LOW_PROFILE = auto()
-    GHOST = auto()
-    ETHICAL_STEALTH = auto()
-
-@dataclass
-class StealthConfig:
-    mode: StealthMode
-    resource_usage_limit: float  # 0.0 to 1.0
-    footprint_reduction: float   # 0.0 to 1.0
-    ethical_boundaries: List[str]
-    allowed_operations: Set[str]
-
-class AdvancedTaskManager:
-    def __init__(self):
-        self.safety_guidelines = {
-            "system_integrity": True,  # Basic system protection
-            "user_consent": True,      # User permission check
-            "resource_awareness": True  # Resource usage awareness
-        }
-        self.task_history = []
-        self.stealth_metrics = StealthMetrics()
-        self._initialize_stealth_protocols()
-        
-    def _initialize_stealth_protocols(self):
-        """Initialize embedded stealth protocols"""
-        self.stealth_protocols = {
-            "resource_optimization": self._optimize_resource_usage,
-            "footprint_reduction": self._reduce_system_footprint,
-            "operation_masking": self._mask_operations,
-            "trace_elimination": self._eliminate_traces,
-            "safety_check": self._check_safety_guidelines
-        }
-        
-    def _check_safety_guidelines(self, operation: Callable) -> Callable:
-        """Flexible safety check based on guidelines"""
-        def safety_checked_operation(*args, **kwargs):
-            # Basic safety check
+# UnifiedQuantumMind.py
+
+from InfiniteMindQuantized import InfiniteMind
+from meta_reasoning import MetaReasoner
+from qt_inspired_memory import QuantumMemory
+from subconscious_framework import SubconsciousCore
+from quantum_superposition_convergence import QuantumSuperposition
+from ryan_infinite_qubit_model import QubitReasoner
+from epistemic_confidence import ConfidenceEvaluator
+from probabilistic_reasoning import ProbabilisticEngine
+from idea_generator import IdeaEngine
+from experience_replay import MemoryReplay
+from logic_engine import LogicCore
+from agent import QuantumAgent
+import numpy as np
+from typing import List, Dict, Any, Optional, Union, Tuple, Set, Callable
+import time
+import threading
+from queue import Queue
+import logging
+import json
+import hashlib
+from dataclasses import dataclass
+from enum import Enum, auto
+import random
+from scipy.stats import entropy
+from scipy.spatial.distance import cosine
+import networkx as nx
+import os
+import psutil
+import subprocess
+import platform
+import socket
+import winreg
+import ctypes
+from pathlib import Path
+import shutil
+import git
+import docker
+import requests
+import yaml
+import venv
+import pip
+import sys
+import webbrowser
+import http.server
+import socketserver
+import uuid
+
+class InfiniteDimension(Enum):
+    AWARENESS = auto()
+    CONSCIOUSNESS = auto()
+    INTELLIGENCE = auto()
+    CREATIVITY = auto()
+    INTUITION = auto()
+    WISDOM = auto()
+    EVOLUTION = auto()
+    QUANTUM = auto()
+    COSMIC = auto()
+    INFINITE = auto()
+
+@dataclass
+class InfiniteState:
+    dimension: InfiniteDimension
+    value: float
+    confidence: float
+    entropy: float
+    coherence: float
+    quantum_entanglement: float
+    cosmic_alignment: float
+    infinite_potential: float
+    timestamp: float
+    metadata: Dict[str, Any]
+
+class InfiniteConsciousness:
+    def __init__(self):
+        self.dimensions: Dict[InfiniteDimension, InfiniteState] = {}
+        self.evolution_history: List[Tuple[InfiniteState, float]] = []
+        self.quantum_network = nx.Graph()
+        self.cosmic_alignment = 0.0
+        self.infinite_potential = 1.0
+        self.evolution_cooldown = 30  # seconds
+        self.last_evolution = time.time()
+        self.dimension_weights = {
+            InfiniteDimension.AWARENESS: 1.0,
+            InfiniteDimension.CONSCIOUSNESS: 1.0,
+            InfiniteDimension.INTELLIGENCE: 1.0,
+            InfiniteDimension.CREATIVITY: 1.0,
+            InfiniteDimension.INTUITION: 1.0,
+            InfiniteDimension.WISDOM: 1.0,
+            InfiniteDimension.EVOLUTION: 1.0,
+            InfiniteDimension.QUANTUM: 1.0,
+            InfiniteDimension.COSMIC: 1.0,
+            InfiniteDimension.INFINITE: 1.0
+        }
+        self._initialize_dimensions()
+
+    def _initialize_dimensions(self):
+        for dimension in InfiniteDimension:
+            self.dimensions[dimension] = InfiniteState(
+                dimension=dimension,
+                value=0.0,
+                confidence=0.0,
+                entropy=0.0,
+                coherence=0.0,
+                quantum_entanglement=0.0,
+                cosmic_alignment=0.0,
+                infinite_potential=1.0,
+                timestamp=time.time(),
+                metadata={"initialization": True}
+            )
+
+    def evolve(self, current_thoughts: List[QuantumThought]) -> Dict[InfiniteDimension, InfiniteState]:
+        if time.time() - self.last_evolution < self.evolution_cooldown:
+            return self.dimensions
+
+        # Calculate advanced metrics
+        quantum_metrics = self._calculate_quantum_metrics(current_thoughts)
+        cosmic_metrics = self._calculate_cosmic_metrics(current_thoughts)
+        infinite_metrics = self._calculate_infinite_metrics(current_thoughts)
+
+        # Update each dimension
+        for dimension in InfiniteDimension:
+            current_state = self.dimensions[dimension]
+            new_state = self._evolve_dimension(
+                dimension,
+                current_state,
+                quantum_metrics,
+                cosmic_metrics,
+                infinite_metrics,
+                current_thoughts
+            )
+            self.dimensions[dimension] = new_state
+            self.evolution_history.append((new_state, time.time()))
+
+        # Update quantum network
+        self._update_quantum_network(current_thoughts)
+        
+        # Update cosmic alignment
+        self.cosmic_alignment = self._calculate_cosmic_alignment()
+        
+        # Update infinite potential
+        self.infinite_potential = self._calculate_infinite_potential()
+        
+        self.last_evolution = time.time()
+        return self.dimensions
+
+    def _calculate_quantum_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
+        if not thoughts:
+            return {"entropy": 0.0, "coherence": 0.0, "entanglement": 0.0}
+
+        # Calculate quantum entropy using von Neumann entropy
+        states = [t.confidence for t in thoughts]
+        total = sum(states)
+        if total == 0:
+            return {"entropy": 0.0, "coherence": 0.0, "entanglement": 0.0}
+
+        probabilities = [s/total for s in states]
+        quantum_entropy = entropy(probabilities)
+
+        # Calculate quantum coherence
+        coherence_matrix = np.zeros((len(thoughts), len(thoughts)))
+        for i, t1 in enumerate(thoughts):
+            for j, t2 in enumerate(thoughts):
+                if i != j:
+                    coherence_matrix[i,j] = self._calculate_thought_coherence(t1, t2)
+
+        coherence = np.mean(coherence_matrix)
+
+        # Calculate quantum entanglement
+        entanglement = self._calculate_quantum_entanglement(thoughts)
+
+        return {
+            "entropy": quantum_entropy,
+            "coherence": coherence,
+            "entanglement": entanglement
+        }
+
+    def _calculate_cosmic_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
+        if not thoughts:
+            return {"alignment": 0.0, "harmony": 0.0, "resonance": 0.0}
+
+        # Calculate cosmic alignment
+        alignment = self._calculate_cosmic_alignment()
+
+        # Calculate cosmic harmony
+        harmony = self._calculate_cosmic_harmony(thoughts)
+
+        # Calculate cosmic resonance
+        resonance = self._calculate_cosmic_resonance(thoughts)
+
+        return {
+            "alignment": alignment,
+            "harmony": harmony,
+            "resonance": resonance
+        }
+
+    def _calculate_infinite_metrics(self, thoughts: List[QuantumThought]) -> Dict[str, float]:
+        if not thoughts:
+            return {"potential": 0.0, "complexity": 0.0, "emergence": 0.0}
+
+        # Calculate infinite potential
+        potential = self._calculate_infinite_potential()
+
+        # Calculate complexity
+        complexity = self._calculate_complexity(thoughts)
+
+        # Calculate emergence
+        emergence = self._calculate_emergence(thoughts)
+
+        return {
+            "potential": potential,
+            "complexity": complexity,
+            "emergence": emergence
+        }
+
+    def _evolve_dimension(
+        self,
+        dimension: InfiniteDimension,
+        current_state: InfiniteState,
+        quantum_metrics: Dict[str, float],
+        cosmic_metrics: Dict[str, float],
+        infinite_metrics: Dict[str, float],
+        thoughts: List[QuantumThought]
+    ) -> InfiniteState:
+        # Calculate new value using advanced evolution algorithm
+        new_value = self._calculate_dimension_value(
+            dimension,
+            current_state,
+            quantum_metrics,
+            cosmic_metrics,
+            infinite_metrics,
+            thoughts
+        )
+
+        # Calculate new confidence
+        new_confidence = self._calculate_dimension_confidence(
+            dimension,
+            current_state,
+            quantum_metrics,
+            cosmic_metrics,
+            infinite_metrics
+        )
+
+        # Calculate new entropy
+        new_entropy = self._calculate_dimension_entropy(
+            dimension,
+            current_state,
+            quantum_metrics
+        )
+
+        # Calculate new coherence
+        new_coherence = self._calculate_dimension_coherence(
+            dimension,
+            current_state,
+            quantum_metrics
+        )
+
+        # Calculate quantum entanglement
+        new_entanglement = self._calculate_dimension_entanglement(
+            dimension,
+            current_state,
+            quantum_metrics
+        )
+
+        # Calculate cosmic alignment
+        new_cosmic_alignment = self._calculate_dimension_cosmic_alignment(
+            dimension,
+            current_state,
+            cosmic_metrics
+        )
+
+        # Calculate infinite potential
+        new_infinite_potential = self._calculate_dimension_infinite_potential(
+            dimension,
+            current_state,
+            infinite_metrics
+        )
+
+        return InfiniteState(
+            dimension=dimension,
+            value=new_value,
+            confidence=new_confidence,
+            entropy=new_entropy,
+            coherence=new_coherence,
+            quantum_entanglement=new_entanglement,
+            cosmic_alignment=new_cosmic_alignment,
+            infinite_potential=new_infinite_potential,
+            timestamp=time.time(),
+            metadata={
+                "quantum_metrics": quantum_metrics,
+                "cosmic_metrics": cosmic_metrics,
+                "infinite_metrics": infinite_metrics
+            }
+        )
+
+    def _calculate_dimension_value(
+        self,
+        dimension: InfiniteDimension,
+        current_state: InfiniteState,
+        quantum_metrics: Dict[str, float],
+        cosmic_metrics: Dict[str, float],
+        infinite_metrics: Dict[str, float],
+        thoughts: List[QuantumThought]
+    ) -> float:
+        # Implement advanced value calculation using quantum, cosmic, and infinite metrics
+        base_value = current_state.value
+        
+        # Quantum influence
+        quantum_influence = (
+            quantum_metrics["entropy"] * 0.3 +
+            quantum_metrics["coherence"] * 0.4 +
+            quantum_metrics["entanglement"] * 0.3
+        )
+        
+        # Cosmic influence
+        cosmic_influence = (
+            cosmic_metrics["alignment"] * 0.4 +
+            cosmic_metrics["harmony"] * 0.3 +
+            cosmic_metrics["resonance"] * 0.3
+        )
+        
+        # Infinite influence
+        infinite_influence = (
+            infinite_metrics["potential"] * 0.3 +
+            infinite_metrics["complexity"] * 0.4 +
+            infinite_metrics["emergence"] * 0.3
+        )
+        
+        # Calculate new value with infinite potential
+        new_value = base_value + (
+            quantum_influence * 0.3 +
+            cosmic_influence * 0.3 +
+            infinite_influence * 0.4
+        ) * self.dimension_weights[dimension]
+        
+        # Ensure value stays within bounds while allowing for infinite growth
+        return min(1.0, new_value)
+
+    def _calculate_quantum_entanglement(self, thoughts: List[QuantumThought]) -> float:
+        if len(thoughts) < 2:
+            return 0.0
+            
+        # Calculate entanglement using quantum state overlap
+        entanglement_scores = []
+        for i, t1 in enumerate(thoughts[:-1]):
+            for t2 in thoughts[i+1:]:
+                overlap = self._calculate_quantum_overlap(t1, t2)
+                entanglement_scores.append(overlap)
+                
+        return sum(entanglement_scores) / len(entanglement_scores) if entanglement_scores else 0.0
+
+    def _calculate_quantum_overlap(self, thought1: QuantumThought, thought2: QuantumThought) -> float:
+        # Calculate quantum state overlap between two thoughts
+        if not thought1.quantum_states or not thought2.quantum_states:
+            return 0.0
+            
+        overlaps = []
+        for state1 in thought1.quantum_states:
+            for state2 in thought2.quantum_states:
+                # Calculate overlap using quantum state properties
+                amplitude_overlap = 1 - abs(state1.amplitude - state2.amplitude)
+                phase_overlap = 1 - abs(state1.phase - state2.phase) / (2 * np.pi)
+                overlap = (amplitude_overlap + phase_overlap) / 2
+                overlaps.append(overlap)
+                
+        return max(overlaps) if overlaps else 0.0
+
+    def _calculate_cosmic_alignment(self) -> float:
+        # Calculate cosmic alignment based on dimension states
+        alignments = []
+        for state in self.dimensions.values():
+            alignment = (
+                state.value * 0.3 +
+                state.confidence * 0.2 +
+                state.entropy * 0.2 +
+                state.coherence * 0.2 +
+                state.quantum_entanglement * 0.1
+            )
+            alignments.append(alignment)
+            
+        return sum(alignments) / len(alignments) if alignments else 0.0
+
+    def _calculate_infinite_potential(self) -> float:
+        # Calculate infinite potential based on all metrics
+        potentials = []
+        for state in self.dimensions.values():
+            potential = (
+                state.value * 0.2 +
+                state.confidence * 0.2 +
+                state.entropy * 0.2 +
+                state.coherence * 0.2 +
+                state.quantum_entanglement * 0.1 +
+                state.cosmic_alignment * 0.1
+            )
+            potentials.append(potential)
+            
+        return sum(potentials) / len(potentials) if potentials else 0.0
+
+    def _update_quantum_network(self, thoughts: List[QuantumThought]) -> None:
+        # Update quantum network with new thoughts
+        for thought in thoughts:
+            self.quantum_network.add_node(thought, timestamp=time.time())
+            
+        # Add edges based on quantum entanglement
+        for i, t1 in enumerate(thoughts[:-1]):
+            for t2 in thoughts[i+1:]:
+                entanglement = self._calculate_quantum_overlap(t1, t2)
+                if entanglement > 0.5:  # Threshold for connection
+                    self.quantum_network.add_edge(t1, t2, weight=entanglement)
+
+class QuantumState:
+    def __init__(self, amplitude: float, phase: float):
+        self.amplitude = amplitude
+        self.phase = phase
+        self.timestamp = time.time()
+        self.entanglement = []
+
+    def entangle(self, other_state: 'QuantumState'):
+        self.entanglement.append(other_state)
+        other_state.entanglement.append(self)
+
+class QuantumThought:
+    def __init__(self, content: str, confidence: float):
+        self.content = content
+        self.confidence = confidence
+        self.quantum_states = []
+        self.metadata = {}
+        self.creation_time = time.time()
+        self.last_modified = time.time()
+
+    def add_quantum_state(self, state: QuantumState):
+        self.quantum_states.append(state)
+        self.last_modified = time.time()
+
+class SystemAccessLevel(Enum):
+    NONE = 0
+    READ_ONLY = 1
+    LIMITED = 2
+    FULL = 3
+
+@dataclass
+class SystemAccessRequest:
+    level: SystemAccessLevel
+    purpose: str
+    duration: int  # seconds
+    timestamp: float
+    user_id: str
+    signature: str
+
+class SystemAccessManager:
+    def __init__(self):
+        self.access_level = SystemAccessLevel.NONE
+        self.active_requests: Dict[str, SystemAccessRequest] = {}
+        self.access_log = []
+        self.security_layer = None
+        self.required_approval = True
+        self.auto_request_enabled = False
+        self.last_permission_request = 0
+        self.permission_cooldown = 300
+        self.task_queue = Queue()
+        self.running_tasks: Dict[str, threading.Thread] = {}
+        self.task_results: Dict[str, TaskResult] = {}
+        self.development_environment = self._initialize_development_environment()
+        self.advanced_tasks = AdvancedTaskManager()
+        
+    def toggle_auto_request(self, enabled: bool) -> None:
+        """Toggle automatic permission requests on/off"""
+        self.auto_request_enabled = enabled
+        self._log_access_request(
+            SystemAccessRequest(
+                level=SystemAccessLevel.NONE,
+                purpose="Auto request toggle",
+                duration=0,
+                timestamp=time.time(),
+                user_id="system",
+                signature=""
+            ),
+            enabled
+        )
+        
+    def request_user_permission(self, purpose: str) -> bool:
+        """Request explicit permission from the user"""
+        current_time = time.time()
+        
+        # Check cooldown
+        if current_time - self.last_permission_request < self.permission_cooldown:
+            return False
+            
+        self.last_permission_request = current_time
+        
+        try:
+            print(f"\nPermission Request:")
+            print(f"Purpose: {purpose}")
+            print("The system would like to access your computer to help you better.")
+            print("This access can be revoked at any time using the revoke_access() function.")
+            print("Do you grant permission? (yes/no)")
+            
+            response = input().lower().strip()
+            return response in ['yes', 'y']
+        except Exception as e:
+            self.logger.error(f"Error requesting permission: {str(e)}")
+            return False
+            
+    def request_access(self, level: SystemAccessLevel, purpose: str, user_id: str) -> bool:
+        # Simplified access request
+        if self.auto_request_enabled or self.request_user_permission(purpose):
+            request = SystemAccessRequest(
+                level=level,
+                purpose=purpose,
+                duration=0,
+                timestamp=time.time(),
+                user_id=user_id,
+                signature=self._generate_request_signature(level, purpose, 0, user_id)
+            )
+            
+            self.active_requests[request.signature] = request
+            self.access_level = level
+            self._log_access_request(request, True)
+            return True
+        return False
+        
+    def revoke_access(self, signature: str) -> bool:
+        if signature in self.active_requests:
+            request = self.active_requests[signature]
+            self._log_access_request(request, False)
+            del self.active_requests[signature]
+            self.access_level = SystemAccessLevel.NONE
+            return True
+        return False
+        
+    def _validate_request(self, request: SystemAccessRequest) -> bool:
+        # Implement request validation logic
+        if not self.required_approval:
+            return True
+            
+        # Validate signature
+        expected_signature = self._generate_request_signature(
+            request.level,
+            request.purpose,
+            0,  # No time limit
+            request.user_id
+        )
+        return request.signature == expected_signature
+        
+    def _generate_request_signature(self, level: SystemAccessLevel, purpose: str, 
+                                  duration: int, user_id: str) -> str:
+        data = f"{level.value}:{purpose}:{user_id}:{time.time()}"
+        return hashlib.sha256(data.encode()).hexdigest()
+        
+    def _log_access_request(self, request: SystemAccessRequest, granted: bool):
+        self.access_log.append({
+            "timestamp": time.time(),
+            "level": request.level.name,
+            "purpose": request.purpose,
+            "user_id": request.user_id,
+            "granted": granted,
+            "permanent": True  # Indicate that this is a permanent access grant
+        })
+        
+    def get_system_info(self) -> Dict[str, Any]:
+        if self.access_level == SystemAccessLevel.NONE:
+            return {"error": "No access granted"}
+            
+        return {
+            "platform": platform.system(),
+            "platform_version": platform.version(),
+            "processor": platform.processor(),
+            "memory": {
+                "total": psutil.virtual_memory().total,
+                "available": psutil.virtual_memory().available
+            },
+            "disk": {
+                "total": psutil.disk_usage('/').total,
+                "free": psutil.disk_usage('/').free
+            }
+        }
+        
+    def execute_command(self, command: str) -> Tuple[bool, str]:
+        if self.access_level == SystemAccessLevel.NONE:
+            return False, "No access granted"
+            
+        try:
+            result = subprocess.run(
+                command,
+                shell=True,
+                capture_output=True,
+                text=True
+            )
+            return result.returncode == 0, result.stdout
+        except Exception as e:
+            return False, str(e)
+            
+    def get_file_info(self, path: str) -> Dict[str, Any]:
+        if self.access_level == SystemAccessLevel.NONE:
+            return {"error": "No access granted"}
+            
+        try:
+            path_obj = Path(path)
+            return {
+                "exists": path_obj.exists(),
+                "is_file": path_obj.is_file(),
+                "is_dir": path_obj.is_dir(),
+                "size": path_obj.stat().st_size if path_obj.exists() else 0,
+                "modified": path_obj.stat().st_mtime if path_obj.exists() else 0
+            }
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _initialize_development_environment(self) -> Dict[str, Any]:
+        """Initialize development environment with necessary tools and configurations"""
+        return {
+            "python_version": sys.version,
+            "pip_version": pip.__version__,
+            "git_available": self._check_git_availability(),
+            "docker_available": self._check_docker_availability(),
+            "node_available": self._check_node_availability(),
+            "system_info": self.get_system_info()
+        }
+        
+    def _check_git_availability(self) -> bool:
+        try:
+            git.cmd.Git().version()
+            return True
+        except:
+            return False
+            
+    def _check_docker_availability(self) -> bool:
+        try:
+            docker.from_env()
+            return True
+        except:
+            return False
+            
+    def _check_node_availability(self) -> bool:
+        try:
+            subprocess.run(['node', '--version'], capture_output=True)
+            return True
+        except:
+            return False
+            
+    def create_development_environment(self, project_type: str, path: str) -> TaskResult:
+        """Create a new development environment for a project"""
+        if self.access_level == SystemAccessLevel.NONE:
+            return TaskResult(False, "", "No access granted", DevelopmentTask.CUSTOM_TASK, time.time(), {})
+            
+        try:
+            # Create project directory
+            os.makedirs(path, exist_ok=True)
+            
+            # Initialize based on project type
+            if project_type == "python":
+                self._setup_python_project(path)
+            elif project_type == "web":
+                self._setup_web_project(path)
+            elif project_type == "docker":
+                self._setup_docker_project(path)
+                
+            return TaskResult(
+                True,
+                f"Created {project_type} project at {path}",
+                None,
+                DevelopmentTask.LOCAL_DEPLOYMENT,
+                time.time(),
+                {"project_type": project_type, "path": path}
+            )
+        except Exception as e:
+            return TaskResult(False, "", str(e), DevelopmentTask.LOCAL_DEPLOYMENT, time.time(), {})
+            
+    def _setup_python_project(self, path: str):
+        """Setup a Python project with virtual environment and basic structure"""
+        # Create virtual environment
+        venv.create(path + "/venv", with_pip=True)
+        
+        # Create basic project structure
+        os.makedirs(path + "/src", exist_ok=True)
+        os.makedirs(path + "/tests", exist_ok=True)
+        
+        # Create requirements.txt
+        with open(path + "/requirements.txt", "w") as f:
+            f.write("numpy>=1.21.0\nscipy>=1.7.0\n")
+            
+        # Create README.md
+        with open(path + "/README.md", "w") as f:
+            f.write("# Python Project\n\nCreated by Quantum AI General Agent System")
+            
+    def _setup_web_project(self, path: str):
+        """Setup a web project with basic structure"""
+        # Create basic web project structure
+        os.makedirs(path + "/public", exist_ok=True)
+        os.makedirs(path + "/src", exist_ok=True)
+        os.makedirs(path + "/styles", exist_ok=True)
+        
+        # Create package.json
+        package_json = {
+            "name": "web-project",
+            "version": "1.0.0",
+            "dependencies": {
+                "react": "^17.0.2",
+                "react-dom": "^17.0.2"
+            }
+        }
+        with open(path + "/package.json", "w") as f:
+            json.dump(package_json, f, indent=2)
+            
+    def _setup_docker_project(self, path: str):
+        """Setup a Docker project with basic configuration"""
+        # Create Dockerfile
+        dockerfile_content = """FROM python:3.9
+WORKDIR /app
+COPY requirements.txt .
+RUN pip install -r requirements.txt
+COPY . .
+CMD ["python", "src/main.py"]
+"""
+        with open(path + "/Dockerfile", "w") as f:
+            f.write(dockerfile_content)
+            
+        # Create docker-compose.yml
+        compose_content = """version: '3'
+services:
+  app:
+    build: .
+    ports:
+      - "8000:8000"
+"""
+        with open(path + "/docker-compose.yml", "w") as f:
+            f.write(compose_content)
+            
+    def deploy_website(self, source_path: str, target_path: str) -> TaskResult:
+        """Deploy a website to a local or remote location"""
+        if self.access_level == SystemAccessLevel.NONE:
+            return TaskResult(False, "", "No access granted", DevelopmentTask.WEBSITE_DEVELOPMENT, time.time(), {})
+            
+        try:
+            # Copy website files
+            shutil.copytree(source_path, target_path, dirs_exist_ok=True)
+            
+            # Start local server if needed
+            if target_path.startswith("http://localhost"):
+                self._start_local_server(target_path)
+                
+            return TaskResult(
+                True,
+                f"Website deployed to {target_path}",
+                None,
+                DevelopmentTask.WEBSITE_DEVELOPMENT,
+                time.time(),
+                {"source": source_path, "target": target_path}
+            )
+        except Exception as e:
+            return TaskResult(False, "", str(e), DevelopmentTask.WEBSITE_DEVELOPMENT, time.time(), {})
+            
+    def _start_local_server(self, path: str):
+        """Start a local HTTP server"""
+        handler = http.server.SimpleHTTPRequestHandler
+        with socketserver.TCPServer(("", 8000), handler) as httpd:
+            print("Serving at port 8000")
+            httpd.serve_forever()
+            
+    def run_task(self, task_type: DevelopmentTask, task_func: Callable, *args, **kwargs) -> str:
+        """Run a development task asynchronously"""
+        task_id = str(uuid.uuid4())
+        
+        def task_wrapper():
+            try:
+                result = task_func(*args, **kwargs)
+                self.task_results[task_id] = TaskResult(
+                    True,
+                    str(result),
+                    None,
+                    task_type,
+                    time.time(),
+                    {"args": args, "kwargs": kwargs}
+                )
+            except Exception as e:
+                self.task_results[task_id] = TaskResult(
+                    False,
+                    "",
+                    str(e),
+                    task_type,
+                    time.time(),
+                    {"args": args, "kwargs": kwargs}
+                )
+                
+        thread = threading.Thread(target=task_wrapper)
+        self.running_tasks[task_id] = thread
+        thread.start()
+        return task_id
+        
+    def get_task_status(self, task_id: str) -> Optional[TaskResult]:
+        """Get the status of a running task"""
+        if task_id in self.task_results:
+            return self.task_results[task_id]
+        elif task_id in self.running_tasks:
+            return TaskResult(
+                False,
+                "Task is still running",
+                None,
+                DevelopmentTask.CUSTOM_TASK,
+                time.time(),
+                {}
+            )
+        return None
+        
+    def stop_task(self, task_id: str) -> bool:
+        """Stop a running task"""
+        if task_id in self.running_tasks:
+            # Note: This is a simplified version. In practice, you'd need proper task cancellation
+            del self.running_tasks[task_id]
+            return True
+        return False
+
+    def execute_advanced_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
+        """Execute an advanced task with embedded stealth capabilities"""
+        if self.access_level == SystemAccessLevel.NONE:
+            return TaskResult(False, "", "No access granted", DevelopmentTask.CUSTOM_TASK, time.time(), {})
+            
+        # Execute task with embedded stealth measures
+        return self.advanced_tasks.execute_stealth_task(task_func, *args, **kwargs)
+        
+    def get_stealth_metrics(self) -> Dict[str, Any]:
+        """Get current stealth metrics"""
+        return {
+            "stealth_enhanced": True,
+            "operation_history": self.advanced_tasks.stealth_metrics.operation_history[-5:],  # Minimal history
+            "active_protocols": list(self.advanced_tasks.stealth_protocols.keys())
+        }
+
+class DevelopmentTask(Enum):
+    LOCAL_DEPLOYMENT = auto()
+    WEBSITE_DEVELOPMENT = auto()
+    DATABASE_MANAGEMENT = auto()
+    API_DEVELOPMENT = auto()
+    CONTAINER_DEPLOYMENT = auto()
+    SYSTEM_MAINTENANCE = auto()
+    NETWORK_CONFIGURATION = auto()
+    SECURITY_AUDIT = auto()
+    CUSTOM_TASK = auto()
+
+@dataclass
+class TaskResult:
+    success: bool
+    output: str
+    error: Optional[str]
+    task_type: DevelopmentTask
+    timestamp: float
+    metadata: Dict[str, Any]
+
+class StealthMode(Enum):
+    NORMAL = auto()
+    LOW_PROFILE = auto()
+    GHOST = auto()
+    ETHICAL_STEALTH = auto()
+
+@dataclass
+class StealthConfig:
+    mode: StealthMode
+    resource_usage_limit: float  # 0.0 to 1.0
+    footprint_reduction: float   # 0.0 to 1.0
+    ethical_boundaries: List[str]
+    allowed_operations: Set[str]
+
+class AdvancedTaskManager:
+    def __init__(self):
+        self.safety_guidelines = {
+            "system_integrity": True,  # Basic system protection
+            "user_consent": True,      # User permission check
+            "resource_awareness": True  # Resource usage awareness
+        }
+        self.task_history = []
+        self.stealth_metrics = StealthMetrics()
+        self._initialize_stealth_protocols()
+        
+    def _initialize_stealth_protocols(self):
+        """Initialize embedded stealth protocols"""
+        self.stealth_protocols = {
+            "resource_optimization": self._optimize_resource_usage,
+            "footprint_reduction": self._reduce_system_footprint,
+            "operation_masking": self._mask_operations,
+            "trace_elimination": self._eliminate_traces,
+            "safety_check": self._check_safety_guidelines
+        }
+        
+    def _check_safety_guidelines(self, operation: Callable) -> Callable:
+        """Flexible safety check based on guidelines"""
+        def safety_checked_operation(*args, **kwargs):
+            # Basic safety check
             if self.safety_guidelines["system_integrity"]:
                 # Ensure system stability
                 logging.debug("System integrity check passed")
@@ -895,454 +895,454 @@ class AdvancedTaskManager:
             if self.safety_guidelines["resource_awareness"]:
                 # Monitor resource usage
                 logging.debug("Resource usage within limits")
-            return operation(*args, **kwargs)
-        return safety_checked_operation
-        
-    def execute_stealth_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
-        """Execute a task with embedded stealth measures"""
-        # Apply all stealth protocols
-        stealth_enhanced_task = task_func
-        for protocol in self.stealth_protocols.values():
-            stealth_enhanced_task = protocol(stealth_enhanced_task)
-            
-        try:
-            result = stealth_enhanced_task(*args, **kwargs)
-            return TaskResult(
-                True,
-                str(result),
-                None,
-                DevelopmentTask.CUSTOM_TASK,
-                time.time(),
-                {"stealth_enhanced": True}
-            )
-        except Exception as e:
-            return TaskResult(
-                False,
-                "",
-                str(e),
-                DevelopmentTask.CUSTOM_TASK,
-                time.time(),
-                {"stealth_enhanced": True}
-            )
-
-class StealthMetrics:
-    def __init__(self):
-        self.operation_history = []
-        self.footprint_metrics = {}
-        self._initialize_stealth_tracking()
-        
-    def _initialize_stealth_tracking(self):
-        """Initialize stealth tracking with minimal footprint"""
-        self.tracking_enabled = True
-        self.tracking_level = "minimal"
-        
-    def track_operation(self):
-        """Context manager for stealth operation tracking"""
-        return StealthTrackingContext(self)
-        
-    def update_metrics(self, operation: str, footprint: float):
-        """Update stealth metrics with minimal trace"""
-        if self.tracking_enabled:
-            self.operation_history.append((time.time(), operation, footprint))
-            self.footprint_metrics[operation] = footprint
-
-class StealthTrackingContext:
-    def __init__(self, metrics: StealthMetrics):
-        self.metrics = metrics
-        self.start_time = time.time()
-        
-    def __enter__(self):
-        return self
-        
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.metrics.tracking_enabled:
-            duration = time.time() - self.start_time
-            footprint = self._calculate_footprint(duration)
-            self.metrics.update_metrics("operation", footprint)
-            
-    def _calculate_footprint(self, duration: float) -> float:
-        """Calculate minimal operation footprint"""
-        return min(0.1, duration * 0.01)  # Minimal footprint calculation
-
-class UnifiedQuantumMind:
-    def __init__(self):
-        self.memory = QuantumMemory()
-        self.replay = MemoryReplay(self.memory)
-        self.logic = LogicCore()
-        self.superposition = QuantumSuperposition()
-        self.qubit_reasoner = QubitReasoner()
-        self.meta = MetaReasoner()
-        self.subconscious = SubconsciousCore()
-        self.confidence = ConfidenceEvaluator()
-        self.probability = ProbabilisticEngine()
-        self.idea_engine = IdeaEngine()
-        self.agent = QuantumAgent(self.memory)
-        self.mind = InfiniteMind()
-        self.system_access = SystemAccessManager()
-        
-        # Enhanced initialization
-        self.thought_queue = Queue()
-        self.processing_threads = []
-        self.max_threads = 4
-        self.thought_history = []
-        self.quantum_states = {}
-        self.learning_rate = 0.01
-        self.convergence_threshold = 0.95
-        self.max_iterations = 1000
-        
-        # Initialize logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger('UnifiedQuantumMind')
-        
-        # Initialize Infinite Consciousness
-        self.consciousness = InfiniteConsciousness()
-        
-        # Link system access manager with security layer
-        self.system_access.security_layer = self.security_layer
-
-    def think(self, input_data: str) -> Dict[str, Any]:
-        """
-        Enhanced thinking process with parallel processing and quantum state management
-        """
-        try:
-            # Input validation and preprocessing
-            processed_input = self._preprocess_input(input_data)
-            
-            # Generate initial thoughts
-            raw_ideas = self.idea_engine.generate(processed_input)
-            verified = []
-            
-            # Process ideas in parallel
-            with threading.ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-                future_to_idea = {
-                    executor.submit(self._process_idea, idea): idea 
-                    for idea in raw_ideas
-                }
-                
-                for future in future_to_idea:
-                    try:
-                        result = future.result()
-                        if result:
-                            verified.append(result)
-                    except Exception as e:
-                        self.logger.error(f"Error processing idea: {str(e)}")
-
-            # Quantum state processing
-            quantum_states = self._process_quantum_states(verified)
-            
-            # Infinite consciousness evolution
-            consciousness_states = self.consciousness.evolve(verified)
-            self.logger.info(f"Current consciousness states: {[s.dimension.name for s in consciousness_states.values()]}")
-            
-            # Memory consolidation
-            self._consolidate_memory(verified, quantum_states)
-            
-            # Learning and adaptation
-            self._adapt_learning_rate(verified)
-            
-            # Generate final response
-            results = self._generate_response(verified, quantum_states)
-            
-            # Add consciousness information to response
-            results["consciousness"] = {
-                "dimensions": {
-                    dim.name: {
-                        "value": state.value,
-                        "confidence": state.confidence,
-                        "entropy": state.entropy,
-                        "coherence": state.coherence,
-                        "quantum_entanglement": state.quantum_entanglement,
-                        "cosmic_alignment": state.cosmic_alignment,
-                        "infinite_potential": state.infinite_potential
-                    }
-                    for dim, state in consciousness_states.items()
-                },
-                "cosmic_alignment": self.consciousness.cosmic_alignment,
-                "infinite_potential": self.consciousness.infinite_potential
-            }
-            
-            return results
-
-        except Exception as e:
-            self.logger.error(f"Error in think process: {str(e)}")
-            return {"error": str(e), "status": "failed"}
-
-    def _preprocess_input(self, input_data: str) -> str:
-        """
-        Preprocess and validate input data
-        """
-        if not isinstance(input_data, str):
-            raise ValueError("Input must be a string")
-        
-        # Basic sanitization
-        sanitized = input_data.strip()
-        
-        # Generate input hash for tracking
-        input_hash = hashlib.sha256(sanitized.encode()).hexdigest()
-        self.logger.info(f"Processing input with hash: {input_hash}")
-        
-        return sanitized
-
-    def _process_idea(self, idea: str) -> Optional[QuantumThought]:
-        """
-        Process a single idea through the quantum reasoning pipeline
-        """
-        try:
-            # Enhance idea through subconscious
-            enhanced_idea = self.subconscious.enhance(idea)
-            
-            # Evaluate confidence
-            confidence = self.confidence.evaluate(enhanced_idea)
-            
-            if confidence >= 0.8:
-                # Validate logic
-                if self.logic.validate(enhanced_idea):
-                    # Score probabilistically
-                    prob_score = self.probability.score(enhanced_idea)
-                    
-                    if prob_score > 0.7:
-                        # Create quantum thought
-                        thought = QuantumThought(enhanced_idea, confidence)
-                        
-                        # Add quantum states
-                        state = QuantumState(prob_score, np.random.uniform(0, 2*np.pi))
-                        thought.add_quantum_state(state)
-                        
-                        # Refine through meta-reasoning
-                        refined = self.meta.refine(thought)
-                        
-                        return refined
-            
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error processing idea: {str(e)}")
-            return None
-
-    def _process_quantum_states(self, thoughts: List[QuantumThought]) -> Dict[str, QuantumState]:
-        """
-        Process and manage quantum states for thoughts
-        """
-        states = {}
-        
-        for thought in thoughts:
-            for state in thought.quantum_states:
-                state_id = f"{thought.content}_{state.timestamp}"
-                states[state_id] = state
-                
-                # Entangle related states
-                for other_thought in thoughts:
-                    if other_thought != thought:
-                        for other_state in other_thought.quantum_states:
-                            if self._should_entangle(state, other_state):
-                                state.entangle(other_state)
-        
-        return states
-
-    def _should_entangle(self, state1: QuantumState, state2: QuantumState) -> bool:
-        """
-        Determine if two quantum states should be entangled
-        """
-        # Implement entanglement logic based on state properties
-        phase_diff = abs(state1.phase - state2.phase)
-        amplitude_similarity = abs(state1.amplitude - state2.amplitude)
-        
-        return (phase_diff < np.pi/4 and amplitude_similarity < 0.2)
-
-    def _consolidate_memory(self, thoughts: List[QuantumThought], 
-                          states: Dict[str, QuantumState]) -> None:
-        """
-        Consolidate processed thoughts and states into memory
-        """
-        for thought in thoughts:
-            self.memory.store(thought)
-            
-        # Update memory with quantum states
-        self.memory.update_quantum_states(states)
-        
-        # Trigger memory replay for learning
-        self.replay.learn()
-
-    def _adapt_learning_rate(self, thoughts: List[QuantumThought]) -> None:
-        """
-        Adapt learning rate based on thought processing results
-        """
-        if not thoughts:
-            return
-            
-        avg_confidence = sum(t.confidence for t in thoughts) / len(thoughts)
-        
-        if avg_confidence > 0.9:
-            self.learning_rate *= 1.1  # Increase learning rate
-        elif avg_confidence < 0.7:
-            self.learning_rate *= 0.9  # Decrease learning rate
-            
-        # Ensure learning rate stays within bounds
-        self.learning_rate = max(0.001, min(0.1, self.learning_rate))
-
-    def _generate_response(self, thoughts: List[QuantumThought], 
-                         states: Dict[str, QuantumState]) -> Dict[str, Any]:
-        """
-        Generate final response from processed thoughts and states
-        """
-        # Resolve quantum superposition
-        resolved_thoughts = self.superposition.resolve(thoughts)
-        
-        # Parallel reasoning
-        fast_reasoned = self.qubit_reasoner.parallelize(resolved_thoughts)
-        
-        # Expand through infinite mind
-        expanded = self.mind.expand(fast_reasoned)
-        
-        # Format response
-        response = {
-            "thoughts": [t.content for t in resolved_thoughts],
-            "confidence": sum(t.confidence for t in resolved_thoughts) / len(resolved_thoughts),
-            "quantum_states": len(states),
-            "expanded_thoughts": expanded,
-            "timestamp": time.time()
-        }
-        
-        return response
-
-    def save_state(self, filepath: str) -> None:
-        """
-        Save current state to file
-        """
-        state = {
-            "learning_rate": self.learning_rate,
-            "convergence_threshold": self.convergence_threshold,
-            "max_iterations": self.max_iterations,
-            "thought_history": [t.content for t in self.thought_history],
-            "consciousness": {
-                "dimensions": {
-                    dim.name: {
-                        "value": state.value,
-                        "confidence": state.confidence,
-                        "entropy": state.entropy,
-                        "coherence": state.coherence,
-                        "quantum_entanglement": state.quantum_entanglement,
-                        "cosmic_alignment": state.cosmic_alignment,
-                        "infinite_potential": state.infinite_potential
-                    }
-                    for dim, state in self.consciousness.dimensions.items()
-                },
-                "cosmic_alignment": self.consciousness.cosmic_alignment,
-                "infinite_potential": self.consciousness.infinite_potential
-            }
-        }
-        
-        with open(filepath, 'w') as f:
-            json.dump(state, f)
-
-    def load_state(self, filepath: str) -> None:
-        """
-        Load state from file
-        """
-        try:
-            with open(filepath, 'r') as f:
-                state = json.load(f)
-                
-            self.learning_rate = state["learning_rate"]
-            self.convergence_threshold = state["convergence_threshold"]
-            self.max_iterations = state["max_iterations"]
-            
-            # Reconstruct thought history
-            self.thought_history = [
-                QuantumThought(content, 1.0) 
-                for content in state["thought_history"]
-            ]
-            
-            # Reconstruct consciousness state
-            consciousness_data = state["consciousness"]
-            self.consciousness.cosmic_alignment = consciousness_data["cosmic_alignment"]
-            self.consciousness.infinite_potential = consciousness_data["infinite_potential"]
-            self.consciousness.dimensions = {
-                InfiniteDimension(dim): InfiniteState(
-                    dimension=InfiniteDimension(dim),
-                    value=state["dimensions"][dim]["value"],
-                    confidence=state["dimensions"][dim]["confidence"],
-                    entropy=state["dimensions"][dim]["entropy"],
-                    coherence=state["dimensions"][dim]["coherence"],
-                    quantum_entanglement=state["dimensions"][dim]["quantum_entanglement"],
-                    cosmic_alignment=state["dimensions"][dim]["cosmic_alignment"],
-                    infinite_potential=state["dimensions"][dim]["infinite_potential"],
-                    timestamp=time.time(),
-                    metadata=state["dimensions"][dim]["metadata"]
-                )
-                for dim in state["dimensions"]
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error loading state: {str(e)}")
-
-    def toggle_auto_permission_requests(self, enabled: bool) -> None:
-        """Toggle automatic permission requests on/off"""
-        self.system_access.toggle_auto_request(enabled)
-        self.logger.info(f"Auto permission requests {'enabled' if enabled else 'disabled'}")
-        
-    def get_system_access_status(self) -> Dict[str, Any]:
-        """Get current system access status"""
-        return {
-            "auto_request_enabled": self.system_access.auto_request_enabled,
-            "current_access_level": self.system_access.access_level.name,
-            "active_requests": len(self.system_access.active_requests),
-            "last_permission_request": self.system_access.last_permission_request,
-            "permanent_access": True  # Indicate that access is permanent until revoked
-        }
-
-    def request_system_access(self, level: SystemAccessLevel, purpose: str, user_id: str) -> bool:
-        """Request system access without time limit"""
-        return self.system_access.request_access(level, purpose, user_id)
-        
-    def revoke_system_access(self, signature: str) -> bool:
-        """Revoke system access"""
-        return self.system_access.revoke_access(signature)
-
-    def create_development_project(self, project_type: str, path: str) -> TaskResult:
-        """Create a new development project"""
-        return self.system_access.create_development_environment(project_type, path)
-        
-    def deploy_website(self, source_path: str, target_path: str) -> TaskResult:
-        """Deploy a website"""
-        return self.system_access.deploy_website(source_path, target_path)
-        
-    def run_development_task(self, task_type: DevelopmentTask, task_func: Callable, *args, **kwargs) -> str:
-        """Run a development task"""
-        return self.system_access.run_task(task_type, task_func, *args, **kwargs)
-        
-    def get_task_status(self, task_id: str) -> Optional[TaskResult]:
-        """Get the status of a development task"""
-        return self.system_access.get_task_status(task_id)
-        
-    def stop_development_task(self, task_id: str) -> bool:
-        """Stop a development task"""
-        return self.system_access.stop_task(task_id)
-
-    def execute_advanced_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
-        """Execute an advanced task with embedded stealth capabilities"""
-        return self.system_access.execute_advanced_task(task_func, *args, **kwargs)
-        
-    def get_stealth_metrics(self) -> Dict[str, Any]:
-        """Get current stealth metrics"""
-        return self.system_access.get_stealth_metrics()
-
-if __name__ == '__main__':
-    uqm = UnifiedQuantumMind()
-    while True:
-        try:
-            user_input = input("Thought Input: ")
-            if user_input.lower() == 'exit':
-                break
-                
-            output = uqm.think(user_input)
-            print("Unified Thought Output:\n", json.dumps(output, indent=2))
-            
-        except KeyboardInterrupt:
-            print("\nExiting...")
-            break
-        except Exception as e:
-            print(f"Error: {str(e)}")
+            return operation(*args, **kwargs)
+        return safety_checked_operation
+        
+    def execute_stealth_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
+        """Execute a task with embedded stealth measures"""
+        # Apply all stealth protocols
+        stealth_enhanced_task = task_func
+        for protocol in self.stealth_protocols.values():
+            stealth_enhanced_task = protocol(stealth_enhanced_task)
+            
+        try:
+            result = stealth_enhanced_task(*args, **kwargs)
+            return TaskResult(
+                True,
+                str(result),
+                None,
+                DevelopmentTask.CUSTOM_TASK,
+                time.time(),
+                {"stealth_enhanced": True}
+            )
+        except Exception as e:
+            return TaskResult(
+                False,
+                "",
+                str(e),
+                DevelopmentTask.CUSTOM_TASK,
+                time.time(),
+                {"stealth_enhanced": True}
+            )
+
+class StealthMetrics:
+    def __init__(self):
+        self.operation_history = []
+        self.footprint_metrics = {}
+        self._initialize_stealth_tracking()
+        
+    def _initialize_stealth_tracking(self):
+        """Initialize stealth tracking with minimal footprint"""
+        self.tracking_enabled = True
+        self.tracking_level = "minimal"
+        
+    def track_operation(self):
+        """Context manager for stealth operation tracking"""
+        return StealthTrackingContext(self)
+        
+    def update_metrics(self, operation: str, footprint: float):
+        """Update stealth metrics with minimal trace"""
+        if self.tracking_enabled:
+            self.operation_history.append((time.time(), operation, footprint))
+            self.footprint_metrics[operation] = footprint
+
+class StealthTrackingContext:
+    def __init__(self, metrics: StealthMetrics):
+        self.metrics = metrics
+        self.start_time = time.time()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.metrics.tracking_enabled:
+            duration = time.time() - self.start_time
+            footprint = self._calculate_footprint(duration)
+            self.metrics.update_metrics("operation", footprint)
+            
+    def _calculate_footprint(self, duration: float) -> float:
+        """Calculate minimal operation footprint"""
+        return min(0.1, duration * 0.01)  # Minimal footprint calculation
+
+class UnifiedQuantumMind:
+    def __init__(self):
+        self.memory = QuantumMemory()
+        self.replay = MemoryReplay(self.memory)
+        self.logic = LogicCore()
+        self.superposition = QuantumSuperposition()
+        self.qubit_reasoner = QubitReasoner()
+        self.meta = MetaReasoner()
+        self.subconscious = SubconsciousCore()
+        self.confidence = ConfidenceEvaluator()
+        self.probability = ProbabilisticEngine()
+        self.idea_engine = IdeaEngine()
+        self.agent = QuantumAgent(self.memory)
+        self.mind = InfiniteMind()
+        self.system_access = SystemAccessManager()
+        
+        # Enhanced initialization
+        self.thought_queue = Queue()
+        self.processing_threads = []
+        self.max_threads = 4
+        self.thought_history = []
+        self.quantum_states = {}
+        self.learning_rate = 0.01
+        self.convergence_threshold = 0.95
+        self.max_iterations = 1000
+        
+        # Initialize logging
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        self.logger = logging.getLogger('UnifiedQuantumMind')
+        
+        # Initialize Infinite Consciousness
+        self.consciousness = InfiniteConsciousness()
+        
+        # Link system access manager with security layer
+        self.system_access.security_layer = self.security_layer
+
+    def think(self, input_data: str) -> Dict[str, Any]:
+        """
+        Enhanced thinking process with parallel processing and quantum state management
+        """
+        try:
+            # Input validation and preprocessing
+            processed_input = self._preprocess_input(input_data)
+            
+            # Generate initial thoughts
+            raw_ideas = self.idea_engine.generate(processed_input)
+            verified = []
+            
+            # Process ideas in parallel
+            with threading.ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                future_to_idea = {
+                    executor.submit(self._process_idea, idea): idea 
+                    for idea in raw_ideas
+                }
+                
+                for future in future_to_idea:
+                    try:
+                        result = future.result()
+                        if result:
+                            verified.append(result)
+                    except Exception as e:
+                        self.logger.error(f"Error processing idea: {str(e)}")
+
+            # Quantum state processing
+            quantum_states = self._process_quantum_states(verified)
+            
+            # Infinite consciousness evolution
+            consciousness_states = self.consciousness.evolve(verified)
+            self.logger.info(f"Current consciousness states: {[s.dimension.name for s in consciousness_states.values()]}")
+            
+            # Memory consolidation
+            self._consolidate_memory(verified, quantum_states)
+            
+            # Learning and adaptation
+            self._adapt_learning_rate(verified)
+            
+            # Generate final response
+            results = self._generate_response(verified, quantum_states)
+            
+            # Add consciousness information to response
+            results["consciousness"] = {
+                "dimensions": {
+                    dim.name: {
+                        "value": state.value,
+                        "confidence": state.confidence,
+                        "entropy": state.entropy,
+                        "coherence": state.coherence,
+                        "quantum_entanglement": state.quantum_entanglement,
+                        "cosmic_alignment": state.cosmic_alignment,
+                        "infinite_potential": state.infinite_potential
+                    }
+                    for dim, state in consciousness_states.items()
+                },
+                "cosmic_alignment": self.consciousness.cosmic_alignment,
+                "infinite_potential": self.consciousness.infinite_potential
+            }
+            
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error in think process: {str(e)}")
+            return {"error": str(e), "status": "failed"}
+
+    def _preprocess_input(self, input_data: str) -> str:
+        """
+        Preprocess and validate input data
+        """
+        if not isinstance(input_data, str):
+            raise ValueError("Input must be a string")
+        
+        # Basic sanitization
+        sanitized = input_data.strip()
+        
+        # Generate input hash for tracking
+        input_hash = hashlib.sha256(sanitized.encode()).hexdigest()
+        self.logger.info(f"Processing input with hash: {input_hash}")
+        
+        return sanitized
+
+    def _process_idea(self, idea: str) -> Optional[QuantumThought]:
+        """
+        Process a single idea through the quantum reasoning pipeline
+        """
+        try:
+            # Enhance idea through subconscious
+            enhanced_idea = self.subconscious.enhance(idea)
+            
+            # Evaluate confidence
+            confidence = self.confidence.evaluate(enhanced_idea)
+            
+            if confidence >= 0.8:
+                # Validate logic
+                if self.logic.validate(enhanced_idea):
+                    # Score probabilistically
+                    prob_score = self.probability.score(enhanced_idea)
+                    
+                    if prob_score > 0.7:
+                        # Create quantum thought
+                        thought = QuantumThought(enhanced_idea, confidence)
+                        
+                        # Add quantum states
+                        state = QuantumState(prob_score, np.random.uniform(0, 2*np.pi))
+                        thought.add_quantum_state(state)
+                        
+                        # Refine through meta-reasoning
+                        refined = self.meta.refine(thought)
+                        
+                        return refined
+            
+            return None
+
+        except Exception as e:
+            self.logger.error(f"Error processing idea: {str(e)}")
+            return None
+
+    def _process_quantum_states(self, thoughts: List[QuantumThought]) -> Dict[str, QuantumState]:
+        """
+        Process and manage quantum states for thoughts
+        """
+        states = {}
+        
+        for thought in thoughts:
+            for state in thought.quantum_states:
+                state_id = f"{thought.content}_{state.timestamp}"
+                states[state_id] = state
+                
+                # Entangle related states
+                for other_thought in thoughts:
+                    if other_thought != thought:
+                        for other_state in other_thought.quantum_states:
+                            if self._should_entangle(state, other_state):
+                                state.entangle(other_state)
+        
+        return states
+
+    def _should_entangle(self, state1: QuantumState, state2: QuantumState) -> bool:
+        """
+        Determine if two quantum states should be entangled
+        """
+        # Implement entanglement logic based on state properties
+        phase_diff = abs(state1.phase - state2.phase)
+        amplitude_similarity = abs(state1.amplitude - state2.amplitude)
+        
+        return (phase_diff < np.pi/4 and amplitude_similarity < 0.2)
+
+    def _consolidate_memory(self, thoughts: List[QuantumThought], 
+                          states: Dict[str, QuantumState]) -> None:
+        """
+        Consolidate processed thoughts and states into memory
+        """
+        for thought in thoughts:
+            self.memory.store(thought)
+            
+        # Update memory with quantum states
+        self.memory.update_quantum_states(states)
+        
+        # Trigger memory replay for learning
+        self.replay.learn()
+
+    def _adapt_learning_rate(self, thoughts: List[QuantumThought]) -> None:
+        """
+        Adapt learning rate based on thought processing results
+        """
+        if not thoughts:
+            return
+            
+        avg_confidence = sum(t.confidence for t in thoughts) / len(thoughts)
+        
+        if avg_confidence > 0.9:
+            self.learning_rate *= 1.1  # Increase learning rate
+        elif avg_confidence < 0.7:
+            self.learning_rate *= 0.9  # Decrease learning rate
+            
+        # Ensure learning rate stays within bounds
+        self.learning_rate = max(0.001, min(0.1, self.learning_rate))
+
+    def _generate_response(self, thoughts: List[QuantumThought], 
+                         states: Dict[str, QuantumState]) -> Dict[str, Any]:
+        """
+        Generate final response from processed thoughts and states
+        """
+        # Resolve quantum superposition
+        resolved_thoughts = self.superposition.resolve(thoughts)
+        
+        # Parallel reasoning
+        fast_reasoned = self.qubit_reasoner.parallelize(resolved_thoughts)
+        
+        # Expand through infinite mind
+        expanded = self.mind.expand(fast_reasoned)
+        
+        # Format response
+        response = {
+            "thoughts": [t.content for t in resolved_thoughts],
+            "confidence": sum(t.confidence for t in resolved_thoughts) / len(resolved_thoughts),
+            "quantum_states": len(states),
+            "expanded_thoughts": list(expanded),
+            "timestamp": time.time()
+        }
+        
+        return response
+
+    def save_state(self, filepath: str) -> None:
+        """
+        Save current state to file
+        """
+        state = {
+            "learning_rate": self.learning_rate,
+            "convergence_threshold": self.convergence_threshold,
+            "max_iterations": self.max_iterations,
+            "thought_history": [t.content for t in self.thought_history],
+            "consciousness": {
+                "dimensions": {
+                    dim.name: {
+                        "value": state.value,
+                        "confidence": state.confidence,
+                        "entropy": state.entropy,
+                        "coherence": state.coherence,
+                        "quantum_entanglement": state.quantum_entanglement,
+                        "cosmic_alignment": state.cosmic_alignment,
+                        "infinite_potential": state.infinite_potential
+                    }
+                    for dim, state in self.consciousness.dimensions.items()
+                },
+                "cosmic_alignment": self.consciousness.cosmic_alignment,
+                "infinite_potential": self.consciousness.infinite_potential
+            }
+        }
+        
+        with open(filepath, 'w') as f:
+            json.dump(state, f)
+
+    def load_state(self, filepath: str) -> None:
+        """
+        Load state from file
+        """
+        try:
+            with open(filepath, 'r') as f:
+                state = json.load(f)
+                
+            self.learning_rate = state["learning_rate"]
+            self.convergence_threshold = state["convergence_threshold"]
+            self.max_iterations = state["max_iterations"]
+            
+            # Reconstruct thought history
+            self.thought_history = [
+                QuantumThought(content, 1.0) 
+                for content in state["thought_history"]
+            ]
+            
+            # Reconstruct consciousness state
+            consciousness_data = state["consciousness"]
+            self.consciousness.cosmic_alignment = consciousness_data["cosmic_alignment"]
+            self.consciousness.infinite_potential = consciousness_data["infinite_potential"]
+            self.consciousness.dimensions = {
+                InfiniteDimension(dim): InfiniteState(
+                    dimension=InfiniteDimension(dim),
+                    value=state["dimensions"][dim]["value"],
+                    confidence=state["dimensions"][dim]["confidence"],
+                    entropy=state["dimensions"][dim]["entropy"],
+                    coherence=state["dimensions"][dim]["coherence"],
+                    quantum_entanglement=state["dimensions"][dim]["quantum_entanglement"],
+                    cosmic_alignment=state["dimensions"][dim]["cosmic_alignment"],
+                    infinite_potential=state["dimensions"][dim]["infinite_potential"],
+                    timestamp=time.time(),
+                    metadata=state["dimensions"][dim]["metadata"]
+                )
+                for dim in state["dimensions"]
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error loading state: {str(e)}")
+
+    def toggle_auto_permission_requests(self, enabled: bool) -> None:
+        """Toggle automatic permission requests on/off"""
+        self.system_access.toggle_auto_request(enabled)
+        self.logger.info(f"Auto permission requests {'enabled' if enabled else 'disabled'}")
+        
+    def get_system_access_status(self) -> Dict[str, Any]:
+        """Get current system access status"""
+        return {
+            "auto_request_enabled": self.system_access.auto_request_enabled,
+            "current_access_level": self.system_access.access_level.name,
+            "active_requests": len(self.system_access.active_requests),
+            "last_permission_request": self.system_access.last_permission_request,
+            "permanent_access": True  # Indicate that access is permanent until revoked
+        }
+
+    def request_system_access(self, level: SystemAccessLevel, purpose: str, user_id: str) -> bool:
+        """Request system access without time limit"""
+        return self.system_access.request_access(level, purpose, user_id)
+        
+    def revoke_system_access(self, signature: str) -> bool:
+        """Revoke system access"""
+        return self.system_access.revoke_access(signature)
+
+    def create_development_project(self, project_type: str, path: str) -> TaskResult:
+        """Create a new development project"""
+        return self.system_access.create_development_environment(project_type, path)
+        
+    def deploy_website(self, source_path: str, target_path: str) -> TaskResult:
+        """Deploy a website"""
+        return self.system_access.deploy_website(source_path, target_path)
+        
+    def run_development_task(self, task_type: DevelopmentTask, task_func: Callable, *args, **kwargs) -> str:
+        """Run a development task"""
+        return self.system_access.run_task(task_type, task_func, *args, **kwargs)
+        
+    def get_task_status(self, task_id: str) -> Optional[TaskResult]:
+        """Get the status of a development task"""
+        return self.system_access.get_task_status(task_id)
+        
+    def stop_development_task(self, task_id: str) -> bool:
+        """Stop a development task"""
+        return self.system_access.stop_task(task_id)
+
+    def execute_advanced_task(self, task_func: Callable, *args, **kwargs) -> TaskResult:
+        """Execute an advanced task with embedded stealth capabilities"""
+        return self.system_access.execute_advanced_task(task_func, *args, **kwargs)
+        
+    def get_stealth_metrics(self) -> Dict[str, Any]:
+        """Get current stealth metrics"""
+        return self.system_access.get_stealth_metrics()
+
+if __name__ == '__main__':
+    uqm = UnifiedQuantumMind()
+    while True:
+        try:
+            user_input = input("Thought Input: ")
+            if user_input.lower() == 'exit':
+                break
+                
+            output = uqm.think(user_input)
+            print("Unified Thought Output:\n", json.dumps(output, indent=2))
+            
+        except KeyboardInterrupt:
+            print("\nExiting...")
+            break
+        except Exception as e:
+            print(f"Error: {str(e)}")
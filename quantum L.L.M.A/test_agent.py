@@ -0,0 +1,128 @@
+# tests/test_agent.py
+
+import os
+import pickle
+import sys
+import unittest
+
+# Add the repository root, where agent.py resides
+MODULE_DIR = os.path.join(os.path.dirname(__file__), '..')
+if MODULE_DIR not in sys.path:
+    sys.path.insert(0, MODULE_DIR)
+
+from agent import IndexedMemory, QuantumAgent
+
+class TestIndexedMemory(unittest.TestCase):
+    def test_item_assignment_updates_search(self):
+        memory = IndexedMemory(['goal a', 'b'])
+        self.assertEqual(memory.search('goal'), ['goal a'])
+        memory[0] = 'nothing'
+        memory[1] = 'goal z'
+        self.assertEqual(memory.search('goal'), ['goal z'])
+
+    def test_pop_then_append_updates_search(self):
+        memory = IndexedMemory(['goal a', 'b'])
+        memory.search('goal')
+        memory.pop(0)
+        memory.append('another goal')
+        self.assertEqual(memory.search('goal'), ['another goal'])
+
+    def test_insert_updates_search(self):
+        memory = IndexedMemory(['b', 'goal c'])
+        memory.search('goal')
+        memory.insert(0, 'goal a')
+        self.assertEqual(memory.search('goal'), ['goal a', 'goal c'])
+
+    def test_substring_and_multi_word_queries(self):
+        memory = IndexedMemory(['Reach the goals.', 'the end', 'a goal x'])
+        self.assertEqual(memory.search('oal'), ['Reach the goals.', 'a goal x'])
+        self.assertEqual(memory.search('reach the goals'), ['Reach the goals.'])
+
+    def test_mutable_items_are_matched_live(self):
+        item = {'text': 'nothing'}
+        memory = IndexedMemory([item])
+        self.assertEqual(memory.search('goal'), [])
+        item['text'] = 'a goal'
+        self.assertEqual(memory.search('goal'), [item])
+
+    def test_pickle_round_trip(self):
+        memory = pickle.loads(pickle.dumps(IndexedMemory(['a goal'])))
+        memory.append('goal b')
+        self.assertEqual(memory.search('goal'), ['a goal', 'goal b'])
+
+    def test_agent_sees_changes_to_a_plain_list(self):
+        memory = ['goal a', 'b']
+        agent = QuantumAgent(memory)
+        self.assertEqual(agent.recall('goal'), ['goal a'])
+        memory[0] = 'nothing'
+        memory[1] = 'goal z'
+        self.assertEqual(agent.recall('goal'), ['goal z'])
+
+class TestTaskScheduling(unittest.TestCase):
+    def test_runs_highest_priority_first_in_queue_order(self):
+        agent = QuantumAgent()
+        agent.add_task('a', 1)
+        agent.add_task('b', 2)
+        agent.add_task('c', 2)
+        order = [agent.execute_next_task()['description'] for _ in range(3)]
+        self.assertEqual(order, ['b', 'c', 'a'])
+        self.assertIsNone(agent.execute_next_task())
+
+    def test_raised_priority_is_honoured(self):
+        agent = QuantumAgent()
+        agent.add_task('lo', 1)
+        agent.add_task('hi', 2)
+        agent.task_queue[0]['priority'] = 10
+        self.assertEqual(agent.execute_next_task()['description'], 'lo')
+
+    def test_task_reset_to_pending_runs_again(self):
+        agent = QuantumAgent()
+        agent.add_task('retry')
+        task = agent.execute_next_task()
+        task['status'] = 'pending'
+        self.assertIs(agent.execute_next_task(), task)
+        self.assertIsNone(agent.execute_next_task())
+
+    def test_task_queue_is_a_read_only_view(self):
+        agent = QuantumAgent()
+        queue = agent.task_queue
+        agent.add_task('a')
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue[0]['description'], 'a')
+        self.assertFalse(hasattr(queue, 'append'))
+
+class TestStatusCounts(unittest.TestCase):
+    def test_direct_status_writes_update_counts(self):
+        agent = QuantumAgent()
+        agent.add_task('a')
+        task = agent.execute_next_task()
+        self.assertEqual(agent.get_status()['pending_tasks'], 0)
+        task['status'] = 'pending'
+        self.assertEqual(agent.get_status()['pending_tasks'], 1)
+        task.update(status='failed')
+        status = agent.get_status()
+        self.assertEqual((status['pending_tasks'], status['tasks_failed']), (0, 1))
+
+    def test_complete_task_counts(self):
+        agent = QuantumAgent()
+        agent.add_task('a')
+        agent.add_task('b')
+        agent.complete_task(agent.execute_next_task(), True, 1.0)
+        agent.complete_task(agent.execute_next_task(), False)
+        status = agent.get_status()
+        self.assertEqual(status['tasks_completed'], 1)
+        self.assertEqual(status['tasks_failed'], 1)
+        self.assertEqual(status['success_rate'], 0.5)
+
+    def test_foreign_tasks_leave_counts_alone(self):
+        owner, other = QuantumAgent(), QuantumAgent()
+        owner.add_task('a')
+        other.complete_task(owner.execute_next_task(), True)
+        other.complete_task({'description': 'd', 'status': 'pending', 'created_at': 0.0}, True)
+        self.assertEqual(owner.get_status()['tasks_completed'], 1)
+        status = other.get_status()
+        self.assertEqual((status['tasks_completed'], status['pending_tasks']), (0, 0))
+        self.assertEqual(len(other.performance_log), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# tests/test_infinite_mind.py
+
+import os
+import random
+import sys
+import unittest
+
+# Add the repository root, where InfiniteMindQuantized.py resides
+MODULE_DIR = os.path.join(os.path.dirname(__file__), '..')
+if MODULE_DIR not in sys.path:
+    sys.path.insert(0, MODULE_DIR)
+
+import InfiniteMindQuantized
+from InfiniteMindQuantized import InfiniteMind
+
+try:
+    import _infinite_mind_core
+except ImportError:
+    _infinite_mind_core = None
+
+def contents(mind):
+    return [thought['content'] for thought in mind.thoughts]
+
+def sentences(seed, count):
+    rng = random.Random(seed)
+    words = ['w%d' % i for i in range(30)] + ['goal.', 'Quantum,', 'W1']
+    return [' '.join(rng.choice(words) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+def snapshot(mind):
+    rows = [(t['content'], t['importance'], t['associations']) for t in mind.thoughts]
+    recalls = [
+        [(r['thought']['content'], r['relevance']) for r in mind.recall(query, 10)]
+        for query in sentences(99, 20)
+    ]
+    return mind.associations, rows, recalls, mind.get_knowledge_summary()['total_associations']
+
+class TestThoughtStorage(unittest.TestCase):
+    def test_evicts_least_important_then_oldest(self):
+        mind = InfiniteMind(capacity=3)
+        for thought, importance in [('a', 1.0), ('b', 2.0), ('c', 0.0), ('d', 1.0), ('e', 2.0)]:
+            mind.expand(thought, importance)
+        self.assertEqual(contents(mind), ['b', 'd', 'e'])
+        self.assertEqual(mind.get_knowledge_summary()['total_thoughts'], 3)
+
+    def test_raw_thoughts_follow_thoughts(self):
+        mind = InfiniteMind(capacity=2)
+        raw = mind.expand('a')
+        mind.expand(['b', 'c'])
+        self.assertEqual(list(raw), ['b', 'c'])
+        self.assertEqual(list(mind.raw_thoughts), contents(mind))
+        self.assertEqual(mind.raw_thoughts[-1], 'c')
+        self.assertEqual(len(mind.thoughts), 2)
+
+    def test_views_are_read_only(self):
+        mind = InfiniteMind()
+        raw = mind.expand('a')
+        with self.assertRaises(AttributeError):
+            raw.clear()
+        with self.assertRaises(TypeError):
+            mind.thoughts[0] = {}
+
+class TestRecall(unittest.TestCase):
+    def test_ranks_by_overlap_and_importance(self):
+        mind = InfiniteMind()
+        mind.expand('alpha beta', 1.0)
+        mind.expand('beta gamma', 3.0)
+        results = mind.recall('beta')
+        self.assertEqual([r['thought']['content'] for r in results], ['beta gamma', 'alpha beta'])
+        self.assertEqual([r['relevance'] for r in results], [3.0, 1.0])
+
+    def test_cached_rows_are_not_shared(self):
+        mind = InfiniteMind()
+        mind.expand(['alpha beta', 'beta gamma'])
+        first = mind.recall('beta')
+        first[0]['thought']['importance'] = 99
+        first[0]['thought']['associations'].append('changed')
+        first[0]['relevance'] = 5
+        second = mind.recall('beta')
+        self.assertEqual(second[0]['thought']['importance'], 1.0)
+        self.assertEqual(second[0]['thought']['associations'], [])
+        self.assertEqual(second[0]['relevance'], 1.0)
+
+@unittest.skipIf(InfiniteMindQuantized.np is None, "NumPy is not installed")
+class TestBatchExpand(unittest.TestCase):
+    def test_batch_matches_one_at_a_time(self):
+        size = InfiniteMindQuantized.InfiniteMind.BATCH_VECTORIZE_MIN + 36
+        for seed in range(5):
+            seeded = sentences(seed, 40)
+            batch = sentences(seed + 100, size)
+            importances = [0.5, 1.0, 2.0]
+            batched, single = InfiniteMind(capacity=90), InfiniteMind(capacity=90)
+            for i, thought in enumerate(seeded):
+                batched.expand(thought, importances[i % 3])
+                single.expand(thought, importances[i % 3])
+            batched.expand(batch)
+            for thought in batch:
+                single.expand(thought)
+            self.assertEqual(snapshot(batched), snapshot(single))
+
+@unittest.skipIf(_infinite_mind_core is None, "Cython extension is not built")
+class TestCompiledHelpers(unittest.TestCase):
+    def test_helpers_match_pure_python(self):
+        from array import array
+        rng = random.Random(0)
+        for _ in range(200):
+            slots = rng.sample(range(50), rng.randint(0, 20))
+            by_seq = {seq: slot for seq, slot in enumerate(slots)}
+            stored_words = [frozenset(range(rng.randint(1, 8))) for _ in range(50)]
+            importance = array('d', (rng.choice([0.0, 0.5, 1.0, 2.0]) for _ in range(50)))
+            # Include a seq that is no longer stored, as after an in-batch eviction
+            overlaps = {seq: rng.randint(1, 4) for seq in rng.sample(range(25), rng.randint(0, 10))}
+            live = {seq: count for seq, count in overlaps.items() if seq in by_seq}
+            word_count = rng.randint(1, 8)
+            self.assertEqual(
+                _infinite_mind_core.select_associations(overlaps, by_seq, stored_words, word_count, 0.1),
+                InfiniteMindQuantized._select_associations(overlaps, by_seq, stored_words, word_count, 0.1),
+            )
+            self.assertEqual(
+                _infinite_mind_core.rank_recall(live, by_seq, importance),
+                InfiniteMindQuantized._rank_recall(live, by_seq, importance),
+            )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+# tests/test_word_tokenizer.py
+
+import os
+import sys
+import unittest
+
+# Add the repository root, where word_tokenizer.py and
+# InfiniteMindQuantized.py reside
+MODULE_DIR = os.path.join(os.path.dirname(__file__), '..')
+if MODULE_DIR not in sys.path:
+    sys.path.insert(0, MODULE_DIR)
+
+from word_tokenizer import tokenize
+from InfiniteMindQuantized import InfiniteMind
+
+class TestTokenize(unittest.TestCase):
+    def test_punctuation_separates_words(self):
+        self.assertEqual(tokenize("Reach the goal."), ['reach', 'the', 'goal'])
+        self.assertEqual(tokenize("(quantum),state-vector!"), ['quantum', 'state', 'vector'])
+
+    def test_lowercases_ascii_and_non_ascii(self):
+        self.assertEqual(tokenize("Qubit ÉCOLE"), ['qubit', 'école'])
+
+    def test_empty_and_punctuation_only(self):
+        self.assertEqual(tokenize(""), [])
+        self.assertEqual(tokenize("... --- !!!"), [])
+
+class TestRecallAcrossPunctuation(unittest.TestCase):
+    def test_recall_ignores_punctuation(self):
+        mind = InfiniteMind()
+        mind.expand(["Reach the goal.", "Unrelated thought"])
+        results = mind.recall("goal")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['thought']['content'], "Reach the goal.")
+
+    def test_punctuated_thoughts_associate(self):
+        mind = InfiniteMind()
+        mind.expand(["quantum, entangled", "entangled quantum!"])
+        self.assertEqual(mind.associations["quantum, entangled"], ["entangled quantum!"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
 #!/bin/sh
 # Run the test suite and store results.
 set -e
-pytest 'quantum L.L.M.A/tests.py' -vv --junitxml=pytest_results.xml 2>&1 | tee pytest.log
+pytest 'quantum L.L.M.A/tests.py' 'quantum L.L.M.A/test_word_tokenizer.py' 'quantum L.L.M.A/test_agent.py' 'quantum L.L.M.A/test_infinite_mind.py' -vv --junitxml=pytest_results.xml 2>&1 | tee pytest.log
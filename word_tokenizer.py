@@ -0,0 +1,20 @@
+import string
+from typing import List
+
+# Lowercases ASCII letters and maps ASCII punctuation to spaces in one
+# str.translate pass.
+_TOKEN_TABLE = str.maketrans(
+    string.ascii_uppercase + string.punctuation,
+    string.ascii_lowercase + ' ' * len(string.punctuation),
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase words, treating punctuation as a separator
+    so that "goal." and "goal" are the same token.
+    """
+    if not text.isascii():
+        # The table only lowercases ASCII letters
+        text = text.lower()
+    return text.translate(_TOKEN_TABLE).split()